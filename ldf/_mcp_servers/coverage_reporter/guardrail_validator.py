@@ -5,11 +5,12 @@ Maps guardrails to test patterns and validates coverage.
 Works with configurable guardrails from .ldf/guardrails.yaml.
 """
 
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import yaml
-
 # Import the central guardrail loader for parity with CLI
 try:
     from ldf.utils.guardrail_loader import get_active_guardrails
@@ -48,10 +49,14 @@ class GuardrailCoverageValidator:
 
     def __init__(self, project_root: Path | None = None):
         self.project_root = project_root or Path.cwd()
-        self._guardrails = None
-        self._patterns = None
-
-    def _load_guardrails(self) -> dict[int, str]:
+        self._guardrails: Mapping[int, str] | None = None
+        self._patterns: Mapping[int, list[str]] | None = None
+        self._compiled_patterns: dict[int, re.Pattern[str]] = {}
+        # Test-file subset of the last coverage report seen, reused across guardrails
+        self._test_files_source: dict[str, Any] | None = None
+        self._test_files: list[tuple[str, dict[str, Any]]] = []
+
+    def _load_guardrails(self) -> Mapping[int, str]:
         """Load guardrail names using the central guardrail_loader.
 
         This ensures parity with CLI lint behavior, respecting:
@@ -64,9 +69,12 @@ class GuardrailCoverageValidator:
         if self._guardrails is not None:
             return self._guardrails
 
-        self._guardrails = dict(self.DEFAULT_GUARDRAIL_NAMES)
+        # Read-only view of the defaults; replaced only when the loader succeeds
+        self._guardrails = MappingProxyType(self.DEFAULT_GUARDRAIL_NAMES)
 
         if HAS_GUARDRAIL_LOADER:
+            import yaml
+
             try:
                 # Use the central loader for consistent behavior with CLI
                 guardrails = get_active_guardrails(self.project_root)
@@ -87,14 +95,21 @@ class GuardrailCoverageValidator:
 
         return self._guardrails
 
-    def _load_patterns(self) -> dict[int, list[str]]:
+    def _load_patterns(self) -> Mapping[int, list[str]]:
         """Load test patterns for guardrails."""
         if self._patterns is not None:
             return self._patterns
 
-        self._patterns = dict(self.DEFAULT_TEST_PATTERNS)
+        self._patterns = MappingProxyType(self.DEFAULT_TEST_PATTERNS)
 
         # Could be extended to load custom patterns from config
+
+        # One case-insensitive alternation per guardrail; patterns match as literal substrings
+        self._compiled_patterns = {
+            guardrail_id: re.compile("|".join(re.escape(p) for p in patterns), re.IGNORECASE)
+            for guardrail_id, patterns in self._patterns.items()
+            if patterns
+        }
         return self._patterns
 
     def get_guardrail_name(self, guardrail_id: int) -> str:
@@ -107,6 +122,23 @@ class GuardrailCoverageValidator:
         patterns = self._load_patterns()
         return patterns.get(guardrail_id, [])
 
+    def get_compiled_pattern(self, guardrail_id: int) -> re.Pattern[str] | None:
+        """Get the combined test file pattern for a guardrail (None for meta-guardrails)."""
+        self._load_patterns()
+        return self._compiled_patterns.get(guardrail_id)
+
+    def _get_test_files(self, coverage_data: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+        """Get (path, file data) pairs for test files, computed once per coverage report."""
+        # Holding a reference to the report keeps the identity check from matching a new object
+        if coverage_data is not self._test_files_source:
+            self._test_files = [
+                (file_path, file_data)
+                for file_path, file_data in coverage_data.get("files", {}).items()
+                if "test" in file_path.lower()
+            ]
+            self._test_files_source = coverage_data
+        return self._test_files
+
     def validate_guardrail_coverage(
         self, guardrail_id: int, coverage_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -123,42 +155,78 @@ class GuardrailCoverageValidator:
                 "valid": True
             }
         """
-        patterns = self.get_test_patterns_for_guardrail(guardrail_id)
+        compiled = self.get_compiled_pattern(guardrail_id)
 
         # Meta-guardrails (Testing, Documentation) don't have specific tests
-        if not patterns:
-            return {
-                "guardrail_id": guardrail_id,
-                "guardrail_name": self.get_guardrail_name(guardrail_id),
-                "has_tests": False,
-                "test_count": 0,
-                "average_coverage": 0.0,
-                "valid": True,  # Meta-guardrails are valid without specific tests
-                "message": "Meta-guardrail - no specific test patterns",
-            }
+        if compiled is None:
+            return self._meta_guardrail_result(guardrail_id)
+
+        # Find matching test files and total their lines in the same pass
+        test_count = total_lines = covered_lines = 0
+        for file_path, file_data in self._get_test_files(coverage_data):
+            if compiled.search(file_path):
+                summary = file_data["summary"]
+                test_count += 1
+                total_lines += summary["num_statements"]
+                covered_lines += summary["covered_lines"]
+
+        return self._coverage_result(guardrail_id, test_count, total_lines, covered_lines)
 
-        # Find matching test files
-        matching_tests = []
-        for file_path, file_data in coverage_data.get("files", {}).items():
-            if "test" in file_path.lower():
-                for pattern in patterns:
-                    if pattern.lower() in file_path.lower():
-                        matching_tests.append(file_data)
-                        break
+    def validate_all(self, coverage_data: dict[str, Any]) -> dict[int, dict[str, Any]]:
+        """
+        Validate test coverage for every guardrail in one walk of the coverage report.
 
+        Returns:
+            Mapping of guardrail ID to the same result validate_guardrail_coverage returns.
+        """
+        patterns = self._load_patterns()
+        compiled = self._compiled_patterns
+        # guardrail_id -> [test_count, total_lines, covered_lines]
+        totals = {guardrail_id: [0, 0, 0] for guardrail_id in compiled}
+
+        # A file may match several guardrails (e.g. "schema"), so test each pattern per file
+        for file_path, file_data in self._get_test_files(coverage_data):
+            summary = file_data["summary"]
+            for guardrail_id, pattern in compiled.items():
+                if pattern.search(file_path):
+                    counts = totals[guardrail_id]
+                    counts[0] += 1
+                    counts[1] += summary["num_statements"]
+                    counts[2] += summary["covered_lines"]
+
+        return {
+            guardrail_id: (
+                self._coverage_result(guardrail_id, *totals[guardrail_id])
+                if guardrail_id in totals
+                else self._meta_guardrail_result(guardrail_id)
+            )
+            for guardrail_id in patterns
+        }
+
+    def _meta_guardrail_result(self, guardrail_id: int) -> dict[str, Any]:
+        """Build the result for a guardrail without specific test patterns."""
+        return {
+            "guardrail_id": guardrail_id,
+            "guardrail_name": self.get_guardrail_name(guardrail_id),
+            "has_tests": False,
+            "test_count": 0,
+            "average_coverage": 0.0,
+            "valid": True,  # Meta-guardrails are valid without specific tests
+            "message": "Meta-guardrail - no specific test patterns",
+        }
+
+    def _coverage_result(
+        self, guardrail_id: int, test_count: int, total_lines: int, covered_lines: int
+    ) -> dict[str, Any]:
+        """Build the result for a guardrail from its matched test file totals."""
         # Calculate average coverage
-        if matching_tests:
-            total_lines = sum(t["summary"]["num_statements"] for t in matching_tests)
-            covered_lines = sum(t["summary"]["covered_lines"] for t in matching_tests)
-            avg_coverage = (covered_lines / total_lines * 100) if total_lines > 0 else 0.0
-        else:
-            avg_coverage = 0.0
+        avg_coverage = (covered_lines / total_lines * 100) if total_lines > 0 else 0.0
 
         return {
             "guardrail_id": guardrail_id,
             "guardrail_name": self.get_guardrail_name(guardrail_id),
-            "has_tests": len(matching_tests) > 0,
-            "test_count": len(matching_tests),
+            "has_tests": test_count > 0,
+            "test_count": test_count,
             "average_coverage": round(avg_coverage, 2),
-            "valid": len(matching_tests) > 0 and avg_coverage >= 80.0,
+            "valid": test_count > 0 and avg_coverage >= 80.0,
         }
@@ -1,7 +1,11 @@
 """LDF multi-agent audit functionality."""
 
+import os
 import re
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 from rich.markdown import Markdown
 from rich.prompt import Confirm
@@ -9,61 +13,178 @@ from rich.prompt import Confirm
 from ldf.utils.console import console
 from ldf.utils.security import SecurityError, is_safe_directory_entry, validate_spec_name
 
-# Patterns to redact when include_secrets=False
-REDACTION_PATTERNS = [
+# PEM block body: anything up to the next "-----". A body can't contain a dash run,
+# so an unterminated BEGIN stops at the next marker instead of scanning to the end
+# of the content (which made many unterminated blocks quadratic).
+_PEM_BODY = r"[^-]*(?:-(?!----)[^-]*)*"
+
+# Patterns to redact when include_secrets=False, as (regex source, replacement, sigils).
+# A pattern can only match content containing one of its sigils (lowercase for (?i)
+# patterns); an empty tuple means it always runs. Quantifiers are kept unambiguous or
+# bounded so that untrusted spec content can't trigger catastrophic backtracking.
+_REDACTION_RULES = [
     # PEM private keys (multiline) - must be first to catch entire blocks
     (
-        r"-----BEGIN[A-Z ]*PRIVATE KEY-----[\s\S]*?-----END[A-Z ]*PRIVATE KEY-----",
+        rf"-----BEGIN[A-Z ]*PRIVATE KEY-----{_PEM_BODY}-----END[A-Z ]*PRIVATE KEY-----",
         "[PEM_KEY_REDACTED]",
+        ("-----BEGIN",),
     ),
     # PEM certificates and other sensitive blocks
     (
         r"-----BEGIN[A-Z ]*(?:PRIVATE|SECRET|ENCRYPTED)[A-Z ]*-----"
-        r"[\s\S]*?"
-        r"-----END[A-Z ]*(?:PRIVATE|SECRET|ENCRYPTED)[A-Z ]*-----",
+        + _PEM_BODY
+        + r"-----END[A-Z ]*(?:PRIVATE|SECRET|ENCRYPTED)[A-Z ]*-----",
         "[PEM_BLOCK_REDACTED]",
+        ("-----BEGIN",),
     ),
     # JWTs (header.payload.signature - base64url encoded)
-    (r"\beyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+\b", "[JWT_REDACTED]"),
+    (r"\beyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]+\b", "[JWT_REDACTED]", ("eyJ",)),
     # GitHub tokens (ghp_, gho_, ghs_, ghr_)
-    (r"\b(ghp|gho|ghs|ghr)_[A-Za-z0-9]{36,}\b", "[GITHUB_TOKEN_REDACTED]"),
+    (
+        r"\b(ghp|gho|ghs|ghr)_[A-Za-z0-9]{36,}\b",
+        "[GITHUB_TOKEN_REDACTED]",
+        ("ghp_", "gho_", "ghs_", "ghr_"),
+    ),
     # Slack tokens
-    (r"\bxox[baprs]-[A-Za-z0-9-]+\b", "[SLACK_TOKEN_REDACTED]"),
+    (r"\bxox[baprs]-[A-Za-z0-9-]+\b", "[SLACK_TOKEN_REDACTED]", ("xox",)),
     # GitLab tokens
-    (r"\bglpat-[A-Za-z0-9\-_]{20,}\b", "[GITLAB_TOKEN_REDACTED]"),
+    (r"\bglpat-[A-Za-z0-9\-_]{20,}\b", "[GITLAB_TOKEN_REDACTED]", ("glpat-",)),
     # npm tokens
-    (r"\bnpm_[A-Za-z0-9]{36,}\b", "[NPM_TOKEN_REDACTED]"),
+    (r"\bnpm_[A-Za-z0-9]{36,}\b", "[NPM_TOKEN_REDACTED]", ("npm_",)),
     # API keys, secrets, passwords, tokens with values (key=value or key: value patterns)
     (
         r"(?i)(api[_-]?key|secret|password|token|credential|auth)"
         r'["\']?\s*[:=]\s*["\']?[^\s"\']{8,}',
         r"\1=[REDACTED]",
+        ("api", "secret", "password", "token", "credential", "auth"),
     ),
     # Prefixed API keys (sk-, pk-, api_, etc.)
-    (r"(?i)\b(sk|pk|api|key|secret|token)[_-][a-zA-Z0-9\-_]{16,}\b", "[API_KEY_REDACTED]"),
+    (
+        r"(?i)\b(sk|pk|api|key|secret|token)[_-][a-zA-Z0-9\-_]{16,}\b",
+        "[API_KEY_REDACTED]",
+        (
+            "sk-",
+            "sk_",
+            "pk-",
+            "pk_",
+            "api-",
+            "api_",
+            "key-",
+            "key_",
+            "secret-",
+            "secret_",
+            "token-",
+            "token_",
+        ),
+    ),
     # Bearer tokens
-    (r"(?i)bearer\s+[a-zA-Z0-9\-._~+/]{20,}=*", "Bearer [REDACTED]"),
+    (r"(?i)bearer\s+[a-zA-Z0-9\-._~+/]{20,}=*", "Bearer [REDACTED]", ("bearer",)),
     # AWS-style keys
     (
-        r"(?i)(aws[_-]?(?:access[_-]?key|secret)[_-]?(?:id)?)"
-        r'\s*[:=]\s*["\']?[A-Z0-9]{16,}',
+        r"(?i)(aws[_-]?(?:access[_-]?key|secret)[_-]?(?:id)?)" r'\s*[:=]\s*["\']?[A-Z0-9]{16,}',
         r"\1=[REDACTED]",
+        ("aws",),
     ),
-    (r"\bAKIA[A-Z0-9]{16}\b", "[AWS_ACCESS_KEY_REDACTED]"),
+    (r"\bAKIA[A-Z0-9]{16}\b", "[AWS_ACCESS_KEY_REDACTED]", ("AKIA",)),
     # Base64-encoded secrets (long base64 that looks like credentials - 64+ chars)
-    (r'(?<=["\':=\s])[A-Za-z0-9+/]{64,}={0,2}(?=["\'\s,\n]|$)', "[BASE64_REDACTED]"),
+    (r'(?<=["\':=\s])[A-Za-z0-9+/]{64,}={0,2}(?=["\'\s,\n]|$)', "[BASE64_REDACTED]", ()),
     # Generic long alphanumeric strings that look like secrets (40+ chars)
-    (r'(?<=["\':=\s])[a-zA-Z0-9]{40,}(?=["\'\s,\n]|$)', "[POSSIBLE_SECRET_REDACTED]"),
+    (r'(?<=["\':=\s])[a-zA-Z0-9]{40,}(?=["\'\s,\n]|$)', "[POSSIBLE_SECRET_REDACTED]", ()),
     # Environment variable references with secret-like names
-    (r"\$\{?(?:SECRET|TOKEN|PASSWORD|API_KEY|CREDENTIALS)[_A-Z]*\}?", "[ENV_VAR_REDACTED]"),
-    # Generic private/secret JSON keys with long values
+    (r"\$\{?(?:SECRET|TOKEN|PASSWORD|API_KEY|CREDENTIALS)[_A-Z]*\}?", "[ENV_VAR_REDACTED]", ("$",)),
+    # Generic private/secret JSON keys with long values (keys are single-line and
+    # bounded so an unclosed quote can't make the keyword search quadratic)
     (
-        r'(?i)"[^"]*(?:private|secret|password|token|key|credential)[^"]*"'
+        r'(?i)"[^"\n]{0,128}?(?:private|secret|password|token|key|credential)[^"\n]{0,128}"'
         r'\s*:\s*"[^"]{20,}"',
         '"[SENSITIVE_KEY]": "[REDACTED]"',
+        ("private", "secret", "password", "token", "key", "credential"),
     ),
 ]
 
+# Compiled once at import; also used by template secret scanning
+REDACTION_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(pattern), replacement) for pattern, replacement, _ in _REDACTION_RULES
+]
+
+# Per-pattern prefilter for _redact_content: (sigils, whether matched case-insensitively)
+_REDACTION_SIGILS: list[tuple[tuple[str, ...], bool]] = [
+    (sigils, pattern.startswith("(?i)")) for pattern, _, sigils in _REDACTION_RULES
+]
+
+# Spec files included in audit requests, in output order
+_AUDIT_SPEC_FILES = ("requirements.md", "design.md", "tasks.md")
+
+# Focus areas listed in the audit request instructions, by audit type
+_AUDIT_FOCUS_AREAS: Mapping[str, str] = MappingProxyType(
+    {
+        "spec-review": (
+            "- Completeness of requirements\n"
+            "- Clarity of acceptance criteria\n"
+            "- Missing edge cases\n"
+            "- Potential security concerns\n"
+            "- Guardrail coverage gaps\n"
+        ),
+        "code-audit": (
+            "- Code quality and patterns\n"
+            "- Security vulnerabilities\n"
+            "- Performance concerns\n"
+            "- Test coverage gaps\n"
+            "- Documentation completeness\n"
+        ),
+        "security": (
+            "- Authentication/authorization gaps\n"
+            "- Input validation issues\n"
+            "- OWASP Top 10 vulnerabilities\n"
+            "- Data exposure risks\n"
+            "- Secure coding practices\n"
+        ),
+        "pre-launch": (
+            "- Production readiness\n"
+            "- Error handling completeness\n"
+            "- Monitoring/observability\n"
+            "- Rollback procedures\n"
+            "- Security hardening\n"
+        ),
+        "gap-analysis": (
+            "- Missing requirements or user stories\n"
+            "- Untested edge cases\n"
+            "- Guardrail coverage gaps\n"
+            "- Undefined error scenarios\n"
+            "- Missing acceptance criteria\n"
+            "- Incomplete test coverage mapping\n"
+        ),
+        "edge-cases": (
+            "- Boundary conditions (min/max values, empty inputs)\n"
+            "- Error handling paths\n"
+            "- Concurrent access scenarios\n"
+            "- Data validation edge cases\n"
+            "- Network failure handling\n"
+            "- Resource exhaustion scenarios\n"
+        ),
+        "architecture": (
+            "- Component coupling analysis\n"
+            "- Scalability concerns\n"
+            "- Data flow correctness\n"
+            "- API design consistency\n"
+            "- Dependency management\n"
+            "- State management patterns\n"
+        ),
+        "full": (
+            "- Requirements completeness and clarity\n"
+            "- Code quality and security vulnerabilities\n"
+            "- Authentication and OWASP Top 10\n"
+            "- Production readiness and monitoring\n"
+            "- Missing requirements and coverage gaps\n"
+            "- Boundary conditions and error handling\n"
+            "- Architecture and scalability\n"
+        ),
+    }
+)
+
+# Spec content budget per audit request; each file is also capped at 5000 chars
+_MAX_SPEC_SECTION_CHARS = 50_000
+
 
 def _redact_content(content: str) -> str:
     """Redact potentially sensitive content from spec export.
@@ -74,9 +195,18 @@ def _redact_content(content: str) -> str:
     Returns:
         Content with sensitive patterns redacted
     """
+    # Skip patterns whose sigils are absent. Only for ASCII content: there str.lower()
+    # agrees with re.IGNORECASE, which also folds characters like U+0131 onto ASCII.
+    prefilter = content.isascii()
+    lowered = content.lower() if prefilter else content
+
     redacted = content
-    for pattern, replacement in REDACTION_PATTERNS:
-        redacted = re.sub(pattern, replacement, redacted)
+    for (pattern, replacement), (sigils, ignore_case) in zip(REDACTION_PATTERNS, _REDACTION_SIGILS):
+        if prefilter and sigils:
+            haystack = lowered if ignore_case else content
+            if not any(sigil in haystack for sigil in sigils):
+                continue
+        redacted = pattern.sub(replacement, redacted)
     return redacted
 
 
@@ -190,7 +320,7 @@ def _run_api_audit(
     from ldf.audit_api import load_api_config, run_api_audit, save_audit_response
 
     # Check if API is configured
-    configs = load_api_config()
+    configs = load_api_config(project_root)
     if agent not in configs:
         if output_format == "json":
             print(
@@ -238,13 +368,13 @@ audit_api:
             return
 
         # Run the API audit
-        response = asyncio.run(run_api_audit(agent, atype, prompt, spec_name))
+        response = asyncio.run(run_api_audit(agent, atype, prompt, spec_name, configs))
         all_responses.append(response)
 
         if output_format != "json":
             if response.success:
                 # Save the response
-                saved_path = save_audit_response(response)
+                saved_path = save_audit_response(response, project_root)
                 console.print(f"[green]Saved: {saved_path}[/green]")
 
                 if auto_import:
@@ -265,7 +395,7 @@ audit_api:
         else:
             # Still save responses in JSON mode
             if response.success:
-                save_audit_response(response)
+                save_audit_response(response, project_root)
 
     # Output JSON if requested
     if output_format == "json":
@@ -344,9 +474,7 @@ def _build_audit_prompt_for_api(
         specs = [spec_path]
     else:
         # SECURITY: Filter out symlinks pointing outside specs_dir and hidden directories
-        specs = [
-            d for d in specs_dir.iterdir() if d.is_dir() and is_safe_directory_entry(d, specs_dir)
-        ]
+        specs = _list_spec_dirs(specs_dir)
 
     if not specs:
         console.print("[yellow]No specs found to audit.[/yellow]")
@@ -398,11 +526,7 @@ def _generate_audit_request(
         except SecurityError as e:
             console.print(f"[red]Error: {e}[/red]")
             # Show available specs (filtered for security)
-            safe_specs = [
-                d
-                for d in specs_dir.iterdir()
-                if d.is_dir() and is_safe_directory_entry(d, specs_dir)
-            ]
+            safe_specs = _list_spec_dirs(specs_dir)
             if safe_specs:
                 available = ", ".join(d.name for d in safe_specs)
                 console.print(f"[dim]Available specs: {available}[/dim]")
@@ -411,11 +535,7 @@ def _generate_audit_request(
         if not spec_path.exists() or not spec_path.is_dir():
             console.print(f"[red]Error: Spec '{spec_name}' not found.[/red]")
             # SECURITY: Filter available specs
-            safe_specs = [
-                d
-                for d in specs_dir.iterdir()
-                if d.is_dir() and is_safe_directory_entry(d, specs_dir)
-            ]
+            safe_specs = _list_spec_dirs(specs_dir)
             if safe_specs:
                 available = ", ".join(d.name for d in safe_specs)
                 console.print(f"[dim]Available specs: {available}[/dim]")
@@ -423,9 +543,7 @@ def _generate_audit_request(
         specs = [spec_path]
     else:
         # SECURITY: Filter out symlinks pointing outside specs_dir and hidden directories
-        specs = [
-            d for d in specs_dir.iterdir() if d.is_dir() and is_safe_directory_entry(d, specs_dir)
-        ]
+        specs = _list_spec_dirs(specs_dir)
 
     # Apply pattern filter if provided
     if pattern and specs:
@@ -512,85 +630,79 @@ def _build_audit_request(
     Returns:
         Formatted audit request markdown
     """
-    content = f"""# Audit Request: {audit_type.replace("-", " ").title()}
+    fingerprint = tuple((spec_path, _spec_file_stats(spec_path)) for spec_path in specs)
+    return _build_audit_request_cached(audit_type, include_secrets, fingerprint)
+
+
+def _list_spec_dirs(specs_dir: Path) -> list[Path]:
+    """List spec directories with a single directory scan.
+
+    SECURITY: Filters out symlinks pointing outside specs_dir and hidden directories.
+    """
+    specs = []
+    with os.scandir(specs_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            path = Path(entry.path)
+            if is_safe_directory_entry(path, specs_dir):
+                specs.append(path)
+    return specs
+
+
+def _spec_file_stats(spec_path: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return (mtime_ns, size) for each audited spec file, or None if it doesn't exist.
+
+    One directory listing finds the files present, so missing files cost no syscall.
+    """
+    stats: dict[str, tuple[int, int]] = {}
+    try:
+        with os.scandir(spec_path) as entries:
+            for entry in entries:
+                if entry.name in _AUDIT_SPEC_FILES:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue  # e.g. a dangling symlink
+                    stats[entry.name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass  # Missing or unreadable spec directory: no files
+    return tuple(stats.get(filename) for filename in _AUDIT_SPEC_FILES)
+
+
+@lru_cache(maxsize=32)
+def _build_audit_request_cached(
+    audit_type: str,
+    include_secrets: bool,
+    fingerprint: tuple[tuple[Path, tuple[tuple[int, int] | None, ...]], ...],
+) -> str:
+    """Build the audit request. fingerprint is part of the cache key so edits invalidate it."""
+    parts = [f"""# Audit Request: {audit_type.replace("-", " ").title()}
 
 ## Instructions
 
 Please review the following specifications and provide feedback on:
 
-"""
-    if audit_type == "spec-review":
-        content += """- Completeness of requirements
-- Clarity of acceptance criteria
-- Missing edge cases
-- Potential security concerns
-- Guardrail coverage gaps
-"""
-    elif audit_type == "code-audit":
-        content += """- Code quality and patterns
-- Security vulnerabilities
-- Performance concerns
-- Test coverage gaps
-- Documentation completeness
-"""
-    elif audit_type == "security":
-        content += """- Authentication/authorization gaps
-- Input validation issues
-- OWASP Top 10 vulnerabilities
-- Data exposure risks
-- Secure coding practices
-"""
-    elif audit_type == "pre-launch":
-        content += """- Production readiness
-- Error handling completeness
-- Monitoring/observability
-- Rollback procedures
-- Security hardening
-"""
-    elif audit_type == "gap-analysis":
-        content += """- Missing requirements or user stories
-- Untested edge cases
-- Guardrail coverage gaps
-- Undefined error scenarios
-- Missing acceptance criteria
-- Incomplete test coverage mapping
-"""
-    elif audit_type == "edge-cases":
-        content += """- Boundary conditions (min/max values, empty inputs)
-- Error handling paths
-- Concurrent access scenarios
-- Data validation edge cases
-- Network failure handling
-- Resource exhaustion scenarios
-"""
-    elif audit_type == "architecture":
-        content += """- Component coupling analysis
-- Scalability concerns
-- Data flow correctness
-- API design consistency
-- Dependency management
-- State management patterns
-"""
-    elif audit_type == "full":
-        content += """- Requirements completeness and clarity
-- Code quality and security vulnerabilities
-- Authentication and OWASP Top 10
-- Production readiness and monitoring
-- Missing requirements and coverage gaps
-- Boundary conditions and error handling
-- Architecture and scalability
-"""
-
-    content += "\n## Specifications\n\n"
-
-    for spec_path in specs:
+"""]
+    parts.append(_AUDIT_FOCUS_AREAS.get(audit_type, ""))
+
+    parts.append("\n## Specifications\n\n")
+
+    total = 0
+    for index, (spec_path, file_stats) in enumerate(fingerprint):
+        # Stop before reading more specs once the request is already large enough
+        if total >= _MAX_SPEC_SECTION_CHARS:
+            omitted = len(fingerprint) - index
+            parts.append(f"... (truncated: {omitted} more spec(s) omitted)\n\n")
+            break
+
         spec_name = spec_path.name
-        content += f"### {spec_name}\n\n"
+        parts.append(f"### {spec_name}\n\n")
 
-        for filename in ["requirements.md", "design.md", "tasks.md"]:
-            filepath = spec_path / filename
-            if filepath.exists():
-                spec_content = filepath.read_text()
+        for filename, file_stat in zip(_AUDIT_SPEC_FILES, file_stats):
+            if file_stat is not None:
+                with open(os.path.join(spec_path, filename), "rb") as f:
+                    spec_content = f.read().decode("utf-8", "replace")
 
                 # Apply redaction unless include_secrets is True
                 if not include_secrets:
@@ -599,9 +711,10 @@ Please review the following specifications and provide feedback on:
                 # Truncate if too long
                 if len(spec_content) > 5000:
                     spec_content = spec_content[:5000] + "\n\n... (truncated)"
-                content += f"#### {filename}\n\n```markdown\n{spec_content}\n```\n\n"
+                parts.append(f"#### {filename}\n\n```markdown\n{spec_content}\n```\n\n")
+                total += len(spec_content)
 
-    content += """## Response Format
+    parts.append("""## Response Format
 
 Please provide your feedback in the following format:
 
@@ -622,8 +735,8 @@ Please provide your feedback in the following format:
 
 [Overall assessment and recommendations]
 ```
-"""
-    return content
+""")
+    return "".join(parts)
 
 
 def _import_feedback(feedback_path: Path, project_root: Path | None = None) -> None:
@@ -6,19 +6,17 @@ for automated spec auditing.
 
 import asyncio
 import os
-import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from ldf.utils.config import load_config
 from ldf.utils.console import console
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuditConfig:
     """Configuration for API-based audits."""
 
@@ -29,7 +27,7 @@ class AuditConfig:
     max_tokens: int = 4096
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResponse:
     """Response from an API audit."""
 
@@ -279,18 +277,10 @@ def load_api_config(project_root: Path | None = None) -> dict[str, AuditConfig]:
     Returns:
         Dict mapping provider names to AuditConfig objects
     """
-    if project_root is None:
-        project_root = Path.cwd()
-
-    config_path = project_root / ".ldf" / "config.yaml"
-    if not config_path.exists():
-        return {}
-
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f) or {}
+        config = load_config(project_root)
     except Exception:
-        return {}
+        return {}  # Missing, unreadable or malformed config
 
     audit_api_config = config.get("audit_api", {})
     configs: dict[str, AuditConfig] = {}
@@ -329,19 +319,25 @@ def _resolve_env_var(value: str) -> str:
 
     Supports ${VAR_NAME} syntax.
     """
-    if not value:
+    if not value or "${" not in value:
         return value
 
-    # Match ${VAR_NAME} pattern
-    pattern = r"\$\{([^}]+)\}"
-    matches = re.findall(pattern, value)
+    # Single left-to-right scan, so substituted values are never re-expanded
+    parts = []
+    pos = 0
+    while True:
+        start = value.find("${", pos)
+        end = value.find("}", start + 2) if start >= 0 else -1
+        if end < 0:
+            parts.append(value[pos:])
+            break
+        var_name = value[start + 2 : end]
+        parts.append(value[pos:start])
+        # ${} isn't a reference; keep it literally
+        parts.append(os.environ.get(var_name, "") if var_name else "${}")
+        pos = end + 1
 
-    result = value
-    for var_name in matches:
-        env_value = os.environ.get(var_name, "")
-        result = result.replace(f"${{{var_name}}}", env_value)
-
-    return result
+    return "".join(parts)
 
 
 def get_auditor(provider: str, configs: dict[str, AuditConfig] | None = None) -> BaseAuditor | None:
@@ -375,6 +371,7 @@ async def run_api_audit(
     audit_type: str,
     prompt: str,
     spec_name: str | None = None,
+    configs: dict[str, AuditConfig] | None = None,
 ) -> AuditResponse:
     """Run an API-based audit.
 
@@ -383,11 +380,12 @@ async def run_api_audit(
         audit_type: Type of audit
         prompt: Audit prompt content
         spec_name: Optional specific spec name
+        configs: Optional pre-loaded configs (loads from config.yaml if not provided)
 
     Returns:
         AuditResponse with results
     """
-    auditor = get_auditor(provider)
+    auditor = get_auditor(provider, configs)
 
     if auditor is None:
         return AuditResponse(
@@ -417,6 +415,10 @@ async def run_api_audit(
     return response
 
 
+# Maps path separators to underscores in a single pass
+_PATH_SEPARATOR_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+
 def _sanitize_filename_component(s: str) -> str:
     """Remove path separators and traversal sequences from filename component.
 
@@ -429,7 +431,7 @@ def _sanitize_filename_component(s: str) -> str:
         Sanitized string safe for use in filenames
     """
     # Replace path separators and parent directory references with underscores
-    return s.replace("/", "_").replace("\\", "_").replace("..", "_")
+    return s.translate(_PATH_SEPARATOR_TABLE).replace("..", "_")
 
 
 def save_audit_response(response: AuditResponse, project_root: Path | None = None) -> Path:
@@ -472,9 +474,14 @@ def save_audit_response(response: AuditResponse, project_root: Path | None = Non
 """
 
     if response.errors:
-        content += "\n\n## Errors\n\n"
-        for error in response.errors:
-            content += f"- {error}\n"
+        content += "\n\n## Errors\n\n" + "".join(f"- {error}\n" for error in response.errors)
 
-    output_path.write_text(content)
+    # One unbuffered write of the encoded response instead of going through the text layer
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
     return output_path
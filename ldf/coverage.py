@@ -14,6 +14,12 @@ from ldf.utils.config import load_config
 from ldf.utils.console import console
 from ldf.utils.guardrail_loader import get_active_guardrails, get_guardrail_by_id
 
+try:
+    # orjson parses multi-megabyte coverage.json files ~2x faster than json
+    from orjson import loads as _json_loads  # type: ignore[import-not-found]
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
 
 def report_coverage(
     service: str | None = None,
@@ -155,14 +161,16 @@ def _find_coverage_data(project_root: Path) -> dict[str, Any] | None:
     ]
 
     for coverage_file in coverage_files:
-        if coverage_file.exists():
-            try:
-                with open(coverage_file) as f:
-                    data = json.load(f)
-                    console.print(f"[dim]Found coverage data: {coverage_file}[/dim]")
-                    return _normalize_coverage_data(data, coverage_file)
-            except (json.JSONDecodeError, KeyError):
-                continue
+        try:
+            raw = coverage_file.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        try:
+            data = _json_loads(raw)
+            console.print(f"[dim]Found coverage data: {coverage_file}[/dim]")
+            return _normalize_coverage_data(data, coverage_file)
+        except (json.JSONDecodeError, KeyError):
+            continue
 
     # Try to run coverage report command
     return _try_generate_coverage(project_root)
@@ -228,9 +236,8 @@ def _try_generate_coverage(project_root: Path) -> dict[str, Any] | None:
             return None
 
         if coverage_file.exists():
-            with open(coverage_file) as f:
-                data = json.load(f)
-                return _normalize_coverage_data(data, coverage_file)
+            data = _json_loads(coverage_file.read_bytes())
+            return _normalize_coverage_data(data, coverage_file)
     except subprocess.SubprocessError as e:
         console.print(f"[yellow]Coverage generation error: {e}[/yellow]")
 
@@ -18,6 +18,7 @@ from ldf.utils.security import SecurityError, is_safe_directory_entry, validate_
 from ldf.utils.spec_parser import (
     extract_guardrail_matrix,
     extract_tasks,
+    flush_spec_cache,
     parse_spec,
 )
 
@@ -307,6 +308,9 @@ def lint_specs(
         lint_report.results.extend(spec_results)
         lint_report.specs_checked += 1
 
+    # Persist newly parsed specs with one cache write for the whole run
+    flush_spec_cache()
+
     # Print summary
     if sarif_mode:
         sarif = _generate_sarif(lint_report, project_root)
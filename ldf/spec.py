@@ -113,9 +113,12 @@ def create_spec(name: str, project_root: Path | None = None) -> bool:
         console.print(f"[dim]Location: {spec_dir}[/dim]")
         return False
 
+    # Status lines are collected and rendered in a single console.print call
+    messages: list[str] = []
+
     # Create spec directory
     spec_dir.mkdir(parents=True, exist_ok=True)
-    console.print(f"[green]✓[/green] Created spec directory: .ldf/specs/{name}/")
+    messages.append(f"[green]✓[/green] Created spec directory: .ldf/specs/{name}/")
 
     # Copy templates using fallback chain
     template_files = ["requirements.md", "design.md", "tasks.md"]
@@ -138,40 +141,47 @@ def create_spec(name: str, project_root: Path | None = None) -> bool:
 
             # Indicate source of template
             if ".ldf-shared" in str(template_path):
-                console.print(f"[green]✓[/green] Created {template_name} [dim](from shared)[/dim]")
+                messages.append(
+                    f"[green]✓[/green] Created {template_name} [dim](from shared)[/dim]"
+                )
             elif "/_framework/" in str(template_path):
-                console.print(
+                messages.append(
                     f"[green]✓[/green] Created {template_name} [dim](from framework)[/dim]"
                 )
             else:
-                console.print(f"[green]✓[/green] Created {template_name}")
+                messages.append(f"[green]✓[/green] Created {template_name}")
         else:
             # Create minimal file if template doesn't exist anywhere
             section_title = template_name.replace(".md", "").title()
             dest_path.write_text(f"# {name} - {section_title}\n\nTODO: Fill in this section.\n")
-            console.print(
+            messages.append(
                 f"[yellow]![/yellow] Created minimal {template_name} (template not found)"
             )
 
     # Create answerpacks directory
     answerpack_dir = answerpacks_dir / name
     answerpack_dir.mkdir(parents=True, exist_ok=True)
-    console.print(f"[green]✓[/green] Created answerpacks directory: .ldf/answerpacks/{name}/")
-
-    # Print next steps
-    console.print()
-    console.print("[bold]Spec created successfully![/bold]")
-    console.print()
-    console.print("[bold]Next steps:[/bold]")
-    console.print(f"  1. Edit [cyan].ldf/specs/{name}/requirements.md[/cyan]")
-    console.print("     - Answer question-pack questions")
-    console.print("     - Define user stories and acceptance criteria")
-    console.print("     - Complete the guardrail coverage matrix")
-    console.print()
-    console.print(f"  2. Validate with: [cyan]ldf lint {name}[/cyan]")
-    console.print()
-    console.print("  3. Continue to design and tasks phases")
-    console.print()
+    messages.append(f"[green]✓[/green] Created answerpacks directory: .ldf/answerpacks/{name}/")
+
+    # Next steps
+    messages.extend(
+        [
+            "",
+            "[bold]Spec created successfully![/bold]",
+            "",
+            "[bold]Next steps:[/bold]",
+            f"  1. Edit [cyan].ldf/specs/{name}/requirements.md[/cyan]",
+            "     - Answer question-pack questions",
+            "     - Define user stories and acceptance criteria",
+            "     - Complete the guardrail coverage matrix",
+            "",
+            f"  2. Validate with: [cyan]ldf lint {name}[/cyan]",
+            "",
+            "  3. Continue to design and tasks phases",
+            "",
+        ]
+    )
+    console.print("\n".join(messages))
 
     return True
 
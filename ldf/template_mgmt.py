@@ -1,7 +1,6 @@
 """Team template export functionality."""
 
 import os
-import re
 import shutil
 import tempfile
 from pathlib import Path
@@ -306,7 +305,7 @@ def _scan_file_for_secrets(file_path: Path, warnings: list[str]) -> None:
 
     # Check for secret patterns
     for pattern, _ in REDACTION_PATTERNS:
-        if re.search(pattern, content):
+        if pattern.search(content):
             warnings.append(f"{file_path.name}: Potential secret detected")
             break  # Only warn once per file
 
@@ -1,11 +1,15 @@
 """LDF configuration utilities."""
 
+import os
+import shutil
 from pathlib import Path
 from typing import Any
 
 import yaml
 from rich.console import Console
 
+from ldf.utils.yaml_cache import load_yaml_cached
+
 console = Console()
 
 
@@ -26,13 +30,12 @@ def load_config(project_root: Path | None = None) -> dict[str, Any]:
 
     config_path = project_root / ".ldf" / "config.yaml"
 
-    if not config_path.exists():
+    try:
+        config: dict[str, Any] = load_yaml_cached(config_path) or {}
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"LDF config not found: {config_path}\nRun 'ldf init' to initialize the project."
-        )
-
-    with open(config_path) as f:
-        config = yaml.safe_load(f) or {}
+        ) from None
 
     return config
 
@@ -172,6 +175,10 @@ def get_default_config() -> dict[str, Any]:
 def save_config(config: dict[str, Any], project_root: Path | None = None) -> None:
     """Save LDF configuration to .ldf/config.yaml.
 
+    The file is written to a sibling temp file and moved into place with
+    os.replace, so an interrupted save never leaves a truncated config. An
+    existing config's permissions are kept.
+
     Args:
         config: Configuration dictionary
         project_root: Project root directory (defaults to cwd)
@@ -182,5 +189,13 @@ def save_config(config: dict[str, Any], project_root: Path | None = None) -> Non
     config_path = project_root / ".ldf" / "config.yaml"
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(config_path, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+    content = yaml.safe_dump(config, default_flow_style=False, sort_keys=False)
+    tmp_path = config_path.with_suffix(".yaml.tmp")
+    try:
+        tmp_path.write_bytes(content.encode("utf-8"))
+        if config_path.exists():
+            shutil.copymode(config_path, tmp_path)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -4,9 +4,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from ldf.utils.logging import get_logger
+from ldf.utils.yaml_cache import load_yaml_cached
 
 logger = get_logger(__name__)
 
@@ -56,8 +55,7 @@ def load_core_guardrails() -> list[Guardrail]:
         )
         return _get_default_core_guardrails()
 
-    with open(CORE_GUARDRAILS_PATH) as f:
-        data = yaml.safe_load(f)
+    data = load_yaml_cached(CORE_GUARDRAILS_PATH)
 
     guardrails = []
     for item in data.get("guardrails", []):
@@ -86,8 +84,7 @@ def load_preset_guardrails(preset: str) -> list[Guardrail]:
         )
         return []
 
-    with open(preset_path) as f:
-        data = yaml.safe_load(f)
+    data = load_yaml_cached(preset_path)
 
     guardrails = []
     for item in data.get("guardrails", []):
@@ -112,8 +109,7 @@ def load_shared_guardrails(shared_resources_path: Path) -> list[Guardrail]:
     guardrails = []
     for yaml_file in sorted(guardrails_dir.glob("*.yaml")):
         try:
-            with open(yaml_file) as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml_cached(yaml_file) or {}
 
             for item in data.get("guardrails", []):
                 guardrails.append(Guardrail.from_dict(item))
@@ -159,8 +155,7 @@ def load_guardrails(
     # Load project guardrails config
     project_guardrails_path = project_root / ".ldf" / "guardrails.yaml"
     if project_guardrails_path.exists():
-        with open(project_guardrails_path) as f:
-            project_config = yaml.safe_load(f) or {}
+        project_config = load_yaml_cached(project_guardrails_path) or {}
 
         # Load preset guardrails
         preset = project_config.get("preset")
@@ -1,9 +1,62 @@
 """LDF spec parsing utilities."""
 
+import json
+import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+from ldf import __version__
+
+# Files that make up a spec, in phase order
+_SPEC_FILES = ("requirements.md", "design.md", "tasks.md")
+
+# On-disk parse cache kept next to the specs directory, in a git-ignored
+# .ldf/.cache/ directory. Bump the schema version whenever parsing output changes.
+_SPEC_CACHE_DIRNAME = ".cache"
+_SPEC_CACHE_FILENAME = "spec_cache.json"
+_SPEC_CACHE_SCHEMA = 2
+
+# Guardrail Coverage Matrix heading, searched on the original text so offsets
+# stay valid for slicing (lowercasing can change the string's length)
+_MATRIX_HEADING_PATTERN = re.compile(r"##\s*Guardrail Coverage Matrix", re.IGNORECASE)
+
+# Matrix separator row (e.g., |---|:---:|)
+_SEPARATOR_ROW_PATTERN = re.compile(r"^\|[-:\s|]+\|$")
+
+# Cell delimiter in a matrix row, absorbing the padding around each pipe
+_CELL_SPLIT_PATTERN = re.compile(r"\s*\|\s*")
+
+# Guardrail ID prefix in the first matrix cell (e.g., "1. Testing Coverage")
+_GUARDRAIL_ID_PATTERN = re.compile(r"(\d+)\.\s*(.+)")
+
+# Single-pass task tokenizer. Alternatives, tried left to right:
+# - task: official bold checklist header, e.g. "- [ ] **Task 1.1:** Title"
+#   (2-level 1.1 and 3-level 1.1.1 IDs; indentation allowed for nested display)
+# - checkbox: checkbox item within a task section
+# - depends: "Depends on:" prefix; the referenced IDs follow on the same line,
+#   or on the next non-blank line when the prefix ends its line
+_TASK_TOKEN_PATTERN = re.compile(
+    r"(?P<task>^\s*-\s*\[\s*(?P<task_checkbox>[xX\s])\s*\]\s*"
+    r"\*\*Task\s+(?P<task_id>\d+\.\d+(?:\.\d+)?):\*\*\s*(?P<title>.+?)(?=\n|$))"
+    r"|(?P<checkbox>- \[(?P<mark>[ xX])\])"
+    r"|(?P<depends>(?i:Depends on):?[^\S\n]*)",
+    re.MULTILINE,
+)
+
+# "Depends on:" prefix inside a task header title
+_DEPENDS_PATTERN = re.compile(r"Depends on:?[^\S\n]*", re.IGNORECASE)
+_DEPENDENCY_ID_PATTERN = re.compile(r"(\d+\.\d+(?:\.\d+)?)")
+
+# Approval markers with flexible whitespace, used when the literal forms aren't present
+_STATUS_APPROVED_PATTERN = re.compile(r"Status:\s*Approved", re.IGNORECASE)
+_APPROVAL_CHECKBOX_PATTERNS = {
+    phase: re.compile(rf"\[x\]\s*{phase} approved", re.IGNORECASE)
+    for phase in ("requirements", "design", "tasks")
+}
 
 
 class SpecStatus(Enum):
@@ -82,34 +135,93 @@ class SpecInfo:
 def parse_spec(spec_path: Path) -> SpecInfo:
     """Parse a spec directory and extract information.
 
+    Results are cached per spec directory and reused while the mtime and size
+    of all three spec files are unchanged. For specs under .ldf/specs/ the
+    results are also kept in .ldf/.cache/spec_cache.json so separate CLI runs
+    can skip parsing; new results are only written when the caller runs
+    flush_spec_cache(). The returned SpecInfo may be shared between calls, so
+    treat it as read-only.
+
     Args:
         spec_path: Path to spec directory
 
     Returns:
         SpecInfo with parsed data
     """
+    fingerprint = _spec_fingerprint(spec_path)
+    return _parse_spec_cached(spec_path, fingerprint)
+
+
+def clear_spec_cache() -> None:
+    """Clear cached spec parse results and file reads.
+
+    On-disk cache updates not yet written by flush_spec_cache() are discarded.
+    """
+    _disk_caches.clear()
+    _parse_spec_cached.cache_clear()
+    _read_text_cached.cache_clear()
+
+
+def flush_spec_cache() -> None:
+    """Write pending on-disk spec cache updates, once per cache file.
+
+    Cache files with no new results are left untouched.
+    """
+    for cache_path, disk_cache in _disk_caches.items():
+        if disk_cache.dirty:
+            disk_cache.stat = _save_disk_cache(cache_path, disk_cache.data)
+            disk_cache.dirty = False
+
+
+@lru_cache(maxsize=128)
+def _parse_spec_cached(
+    spec_path: Path, fingerprint: tuple[tuple[int, int] | None, ...]
+) -> SpecInfo:
+    """Parse a spec directory. fingerprint is part of the cache key so edits invalidate it."""
+    cache_path = _disk_cache_path(spec_path)
+    if cache_path is None:
+        return _parse_spec_files(spec_path, fingerprint)
+
+    cache_key = [list(fp) if fp is not None else None for fp in fingerprint]
+    disk_cache = _load_disk_cache(cache_path)
+    specs = disk_cache.data.setdefault("specs", {})
+
+    entry = specs.get(spec_path.name)
+    if entry and entry.get("fingerprint") == cache_key:
+        try:
+            return _spec_info_from_dict(entry["info"])
+        except (KeyError, TypeError, ValueError):
+            pass  # Unreadable entry; parse again and overwrite it
+
+    info = _parse_spec_files(spec_path, fingerprint)
+
+    specs[spec_path.name] = {"fingerprint": cache_key, "info": _spec_info_to_dict(info)}
+    disk_cache.dirty = True
+    return info
+
+
+def _parse_spec_files(spec_path: Path, fingerprint: tuple[tuple[int, int] | None, ...]) -> SpecInfo:
+    """Parse the files of a spec directory."""
     info = SpecInfo(name=spec_path.name, status=SpecStatus.NOT_STARTED)
 
     # Check which files exist
-    requirements_path = spec_path / "requirements.md"
-    design_path = spec_path / "design.md"
-    tasks_path = spec_path / "tasks.md"
+    requirements_fp, design_fp, tasks_fp = fingerprint
 
-    info.has_requirements = requirements_path.exists()
-    info.has_design = design_path.exists()
-    info.has_tasks = tasks_path.exists()
+    info.has_requirements = requirements_fp is not None
+    info.has_design = design_fp is not None
+    info.has_tasks = tasks_fp is not None
 
     # Parse requirements
-    if info.has_requirements:
-        _parse_requirements(requirements_path, info)
+    if requirements_fp is not None:
+        _parse_requirements(_read_text(spec_path / "requirements.md", requirements_fp), info)
 
     # Parse design
-    if info.has_design:
-        _parse_design(design_path, info)
+    if design_fp is not None:
+        _parse_design(_read_text(spec_path / "design.md", design_fp), info)
 
     # Parse tasks
-    if info.has_tasks:
-        _parse_tasks(tasks_path, info)
+    if tasks_fp is not None:
+        _parse_tasks(_read_text(spec_path / "tasks.md", tasks_fp), info)
 
     # Determine overall status
     info.status = _determine_status(info)
@@ -117,6 +229,129 @@ def parse_spec(spec_path: Path) -> SpecInfo:
     return info
 
 
+@dataclass
+class _DiskCache:
+    """An on-disk spec cache file loaded into memory."""
+
+    data: dict[str, Any]
+    stat: tuple[int, int] | None  # (mtime_ns, size) of the file when loaded or written
+    dirty: bool = False
+
+
+# Loaded cache files by path, so each is read once per process rather than per spec
+_disk_caches: dict[Path, _DiskCache] = {}
+
+
+def _disk_cache_path(spec_path: Path) -> Path | None:
+    """Return the on-disk cache file for a spec, or None if it isn't under .ldf/specs/."""
+    specs_dir = spec_path.parent
+    if specs_dir.name != "specs" or specs_dir.parent.name != ".ldf":
+        return None
+    return specs_dir.parent / _SPEC_CACHE_DIRNAME / _SPEC_CACHE_FILENAME
+
+
+def _file_stat(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_disk_cache(cache_path: Path) -> _DiskCache:
+    """Return the in-memory copy of a cache file, reading it only when it has changed.
+
+    A copy with unwritten updates is kept as is. A missing, unreadable or stale
+    file yields an empty cache.
+    """
+    stat = _file_stat(cache_path)
+    disk_cache = _disk_caches.get(cache_path)
+    if disk_cache is not None and (disk_cache.dirty or disk_cache.stat == stat):
+        return disk_cache
+
+    data: Any = None
+    if stat is not None:
+        try:
+            data = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+    if (
+        not isinstance(data, dict)
+        or data.get("schema") != _SPEC_CACHE_SCHEMA
+        or data.get("ldf_version") != __version__
+        or not isinstance(data.get("specs", {}), dict)
+    ):
+        data = {}
+
+    disk_cache = _disk_caches[cache_path] = _DiskCache(data=data, stat=stat)
+    return disk_cache
+
+
+def _save_disk_cache(cache_path: Path, cache: dict[str, Any]) -> tuple[int, int] | None:
+    """Write a cache file atomically and return its new stat.
+
+    Failures are ignored; the cache is optional.
+    """
+    cache["schema"] = _SPEC_CACHE_SCHEMA
+    cache["ldf_version"] = __version__
+    cache_dir = cache_path.parent
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        if not cache_dir.is_dir():
+            cache_dir.mkdir()
+            # Keep the cache out of version control
+            (cache_dir / ".gitignore").write_text("*\n")
+        tmp_path.write_text(json.dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return None
+    return _file_stat(cache_path)
+
+
+def _spec_info_to_dict(info: SpecInfo) -> dict[str, Any]:
+    """Serialize SpecInfo to JSON-compatible data."""
+    data = asdict(info)
+    data["status"] = info.status.value
+    return data
+
+
+def _spec_info_from_dict(data: dict[str, Any]) -> SpecInfo:
+    """Rebuild SpecInfo from data produced by _spec_info_to_dict."""
+    return SpecInfo(
+        **{
+            **data,
+            "status": SpecStatus(data["status"]),
+            "guardrail_matrix": [GuardrailMatrixRow(**row) for row in data["guardrail_matrix"]],
+            "tasks": [TaskItem(**task) for task in data["tasks"]],
+        }
+    )
+
+
+def _spec_fingerprint(spec_path: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Return (mtime_ns, size) for each spec file, or None for files that don't exist.
+
+    One directory listing finds the files present, so missing files cost no syscall.
+    """
+    stats: dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(spec_path) as entries:
+            for entry in entries:
+                if entry.name in _SPEC_FILES:
+                    try:
+                        if entry.is_file():
+                            stats[entry.name] = entry.stat()
+                    except OSError:
+                        continue  # e.g. a dangling symlink
+    except OSError:
+        pass  # Missing or unreadable spec directory: no files
+    return tuple(
+        (stat.st_mtime_ns, stat.st_size) if (stat := stats.get(name)) else None
+        for name in _SPEC_FILES
+    )
+
+
 def get_spec_status(spec_path: Path) -> SpecStatus:
     """Get just the status of a spec.
 
@@ -129,48 +364,64 @@ def get_spec_status(spec_path: Path) -> SpecStatus:
     return parse_spec(spec_path).status
 
 
-def extract_guardrail_matrix(content: str) -> list[GuardrailMatrixRow]:
+def extract_guardrail_matrix(content: str, start: int = 0) -> list[GuardrailMatrixRow]:
     """Extract the guardrail coverage matrix from markdown content.
 
     Args:
         content: Markdown content containing the matrix
+        start: Offset to begin searching from (e.g. the already-known offset of the
+            matrix heading), so the rest of the document isn't rescanned
 
     Returns:
         List of GuardrailMatrixRow objects
     """
     rows: list[GuardrailMatrixRow] = []
 
-    # Find the matrix section (allow optional lines like **Reference:** before table)
-    # Pattern: header, then skip any lines that don't start with |, then capture the table
-    matrix_pattern = (
-        r"##\s*Guardrail Coverage Matrix[^\n]*\n+"  # Header line
-        r"(?:(?!\|)[^\n]*\n)*"  # Skip non-table lines (e.g., **Reference:**)
-        r"(\|.+\|[\s\S]*?)"  # Capture the table
-        r"(?=\n##|\n\n\n|\Z)"  # Until next section or end
-    )
-    matrix_match = re.search(matrix_pattern, content, re.IGNORECASE)
-
-    if not matrix_match:
+    # Locate the section with a regex search for the heading (on the original text,
+    # so offsets stay valid) and a plain string search for its end: linear time,
+    # no regex backtracking
+    heading_match = _MATRIX_HEADING_PATTERN.search(content, start)
+    if heading_match is None:
         return rows
-
-    matrix_text = matrix_match.group(1)
-    lines = matrix_text.strip().split("\n")
+    heading = heading_match.start()
+
+    end = content.find("\n##", heading + 2)
+    section_lines = content[heading : end if end != -1 else len(content)].split("\n")
+
+    # Skip lines before the table (e.g., **Reference:**), then take the table
+    # until the section ends or two blank lines in a row
+    table_lines: list[str] = []
+    blank_run = 0
+    for line in section_lines[1:]:
+        if not table_lines and not line.startswith("|"):
+            continue
+        if not line:
+            blank_run += 1
+            if blank_run == 2:
+                break
+            continue
+        blank_run = 0
+        table_lines.append(line)
 
     # Skip header and separator rows
     data_lines = [
         line
-        for line in lines
+        for line in table_lines
         if line.strip().startswith("|")
-        and not re.match(r"^\|[-:\s|]+\|$", line)
+        and not _SEPARATOR_ROW_PATTERN.match(line)
         and "Guardrail" not in line
     ]
 
     for line in data_lines:
-        cells = [cell.strip() for cell in line.split("|")[1:-1]]
+        # Drop only the outer pipes, so an empty first or last cell keeps its column;
+        # one C-level split then yields already-stripped cells
+        row = line.strip()
+        row = row[1:-1] if len(row) > 1 and row.endswith("|") else row[1:]
+        cells = _CELL_SPLIT_PATTERN.split(row.strip())
         if len(cells) >= 6:
             # Extract guardrail ID from first cell (e.g., "1. Testing Coverage")
             first_cell = cells[0]
-            id_match = re.match(r"(\d+)\.\s*(.+)", first_cell)
+            id_match = _GUARDRAIL_ID_PATTERN.match(first_cell)
             if id_match:
                 guardrail_id = int(id_match.group(1))
                 guardrail_name = id_match.group(2).strip()
@@ -215,86 +466,144 @@ def extract_tasks(content: str) -> list[TaskItem]:
         List of TaskItem objects
     """
     # For user-facing documentation on task formats, see: docs/task-format.md
-    tasks = []
-
-    # Pattern for official bold checklist format only:
-    # - [ ] **Task 1.1:** Title
-    # - [x] **Task 1.2:** Completed task
-    # Supports 2-level (1.1) and 3-level (1.1.1) task IDs
-    # Indentation allowed for nested display
-    task_pattern = re.compile(
-        r"^\s*-\s*\[\s*([xX\s])\s*\]\s*\*\*Task\s+(\d+\.\d+(?:\.\d+)?):\*\*\s*(.+?)(?=\n|$)",
-        re.MULTILINE,
-    )
+    tasks: list[TaskItem] = []
+
+    # Per-task state for the task currently being scanned
+    header_checked = False
+    total = completed = 0
+    deps_found = False
+
+    # One scan over content: a task header opens a new task, and every checkbox
+    # or dependency line up to the next header is attributed to it
+    for match in _TASK_TOKEN_PATTERN.finditer(content):
+        kind = match.lastgroup
+
+        if kind == "task":
+            if tasks:
+                tasks[-1].status = _task_status(header_checked, total, completed)
+
+            header = match.group("task")
+            title = match.group("title").strip()
+            header_checked = match.group("task_checkbox").lower() == "x"
+            completed = header.count("- [x]") + header.count("- [X]")
+            total = completed + header.count("- [ ]")
+
+            deps: list[str] = []
+            dep_match = _DEPENDS_PATTERN.search(header)
+            dep_text = (
+                _dependency_text(content, match.start() + dep_match.end()) if dep_match else None
+            )
+            deps_found = dep_text is not None
+            if dep_text is not None:
+                deps = [d.strip() for d in _DEPENDENCY_ID_PATTERN.findall(dep_text)]
 
-    # Pattern for checkbox items within task section
-    checkbox_pattern = re.compile(r"- \[([ xX])\]")
-
-    # Collect all task matches first to determine section boundaries
-    all_matches = list(task_pattern.finditer(content))
-
-    for i, match in enumerate(all_matches):
-        checkbox_status = match.group(1)  # space, x, or X
-        task_id = match.group(2)
-        title = match.group(3).strip()
-
-        # Determine status based on checkbox and subtask checkboxes
-        # Find the section for this task: from current task to next task (or end of content)
-        start_pos = match.start()
-
-        # Find the next task position
-        if i + 1 < len(all_matches):
-            end_pos = all_matches[i + 1].start()
-        else:
-            end_pos = len(content)
-
-        task_section = content[start_pos:end_pos]
-
-        # Determine status from all checkboxes in this task's section
-        checkboxes = checkbox_pattern.findall(task_section)
-        if checkboxes:
-            completed = sum(1 for c in checkboxes if c.lower() == "x")
-            if completed == len(checkboxes):
-                status = "complete"
-            elif completed > 0:
-                status = "in_progress"
-            else:
-                status = "pending"
-        else:
-            # No checkboxes found (shouldn't happen with bold format)
-            status = "complete" if checkbox_status.lower() == "x" else "pending"
-
-        # Extract dependencies (supports both Task 1.1 and Task 1.1.1 formats)
-        deps = []
-        dep_match = re.search(r"Depends on:?\s*(.+?)(?=\n|$)", task_section, re.IGNORECASE)
-        if dep_match:
-            deps = [d.strip() for d in re.findall(r"(\d+\.\d+(?:\.\d+)?)", dep_match.group(1))]
-
-        tasks.append(
-            TaskItem(
-                id=task_id,
-                title=title,
-                status=status,
-                dependencies=deps,
+            tasks.append(
+                TaskItem(
+                    id=match.group("task_id"), title=title, status="pending", dependencies=deps
+                )
             )
-        )
+        elif not tasks:
+            # Checkboxes and dependencies before the first task belong to no task
+            continue
+        elif kind == "checkbox":
+            total += 1
+            if match.group("mark").lower() == "x":
+                completed += 1
+        elif kind == "depends" and not deps_found:
+            # Extract dependencies (supports both Task 1.1 and Task 1.1.1 formats)
+            dep_text = _dependency_text(content, match.end())
+            if dep_text is not None:
+                deps_found = True
+                tasks[-1].dependencies = [
+                    d.strip() for d in _DEPENDENCY_ID_PATTERN.findall(dep_text)
+                ]
+
+    if tasks:
+        tasks[-1].status = _task_status(header_checked, total, completed)
 
     return tasks
 
 
-def _parse_requirements(filepath: Path, info: SpecInfo) -> None:
-    """Parse requirements.md and update SpecInfo."""
-    content = filepath.read_text()
+def _dependency_text(content: str, pos: int) -> str | None:
+    """Return the text listing dependencies after a "Depends on:" prefix ending at pos.
+
+    That is the rest of the line, or the next non-blank line when the prefix ends
+    its line. Returns None if there is no such text before the next task header.
+    """
+    line_end = content.find("\n", pos)
+    if line_end == -1:
+        return content[pos:] or None
+    if pos < line_end:
+        return content[pos:line_end]
+
+    start = line_end + 1
+    while start < len(content):
+        end = content.find("\n", start)
+        line = content[start : end if end != -1 else None]
+        if line.strip():
+            next_token = _TASK_TOKEN_PATTERN.match(line)
+            if next_token and next_token.lastgroup == "task":
+                return None  # The next task starts before any dependency text
+            return line
+        if end == -1:
+            break
+        start = end + 1
+    return None
+
+
+def _task_status(header_checked: bool, total: int, completed: int) -> str:
+    """Determine a task's status from its checkbox counts."""
+    if total:
+        if completed == total:
+            return "complete"
+        if completed > 0:
+            return "in_progress"
+        return "pending"
+    # No checkboxes found (shouldn't happen with bold format)
+    return "complete" if header_checked else "pending"
+
+
+@lru_cache(maxsize=256)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a spec file. mtime_ns and size are part of the cache key so edits invalidate it."""
+    return Path(path).read_text()
+
+
+def _read_text(filepath: Path, fingerprint: tuple[int, int]) -> str:
+    """Read a spec file, reusing the previous read if its (mtime_ns, size) is unchanged."""
+    return _read_text_cached(str(filepath), *fingerprint)
+
+
+def _is_approved(content: str, phase: str) -> bool:
+    """Check for "Status: Approved" or a checked "[x] <phase> approved" marker.
+
+    Literal substring checks on the lowercased content handle the common forms;
+    the regexes only run when "approved" appears in some other spacing.
+    """
+    lowered = content.lower()
+    if "approved" not in lowered:
+        return False
+    if "status: approved" in lowered or f"[x] {phase} approved" in lowered:
+        return True
+    return bool(
+        _STATUS_APPROVED_PATTERN.search(content)
+        or _APPROVAL_CHECKBOX_PATTERNS[phase].search(content)
+    )
+
+
+def _parse_requirements(content: str, info: SpecInfo) -> None:
+    """Parse requirements.md content and update SpecInfo."""
 
     # Check for Question-Pack Answers section
     if "## Question-Pack Answers" not in content:
         info.errors.append("requirements.md: Missing Question-Pack Answers section")
 
-    # Check for Guardrail Coverage Matrix
-    if "## Guardrail Coverage Matrix" not in content:
+    # Check for Guardrail Coverage Matrix (the table search starts at its heading)
+    matrix_start = content.find("## Guardrail Coverage Matrix")
+    if matrix_start == -1:
         info.errors.append("requirements.md: Missing Guardrail Coverage Matrix")
     else:
-        info.guardrail_matrix = extract_guardrail_matrix(content)
+        info.guardrail_matrix = extract_guardrail_matrix(content, matrix_start)
         if not info.guardrail_matrix:
             info.warnings.append("requirements.md: Guardrail matrix found but empty")
 
@@ -303,30 +612,24 @@ def _parse_requirements(filepath: Path, info: SpecInfo) -> None:
         info.warnings.append("requirements.md: No user stories found")
 
     # Check for approval status
-    if re.search(r"Status:\s*Approved", content, re.IGNORECASE):
-        info.requirements_approved = True
-    elif re.search(r"\[x\]\s*Requirements approved", content, re.IGNORECASE):
+    if _is_approved(content, "requirements"):
         info.requirements_approved = True
 
 
-def _parse_design(filepath: Path, info: SpecInfo) -> None:
-    """Parse design.md and update SpecInfo."""
-    content = filepath.read_text()
+def _parse_design(content: str, info: SpecInfo) -> None:
+    """Parse design.md content and update SpecInfo."""
 
     # Check for Guardrail Mapping section
     if "## Guardrail Mapping" not in content:
         info.warnings.append("design.md: Missing Guardrail Mapping section")
 
     # Check for approval status
-    if re.search(r"Status:\s*Approved", content, re.IGNORECASE):
-        info.design_approved = True
-    elif re.search(r"\[x\]\s*Design approved", content, re.IGNORECASE):
+    if _is_approved(content, "design"):
         info.design_approved = True
 
 
-def _parse_tasks(filepath: Path, info: SpecInfo) -> None:
-    """Parse tasks.md and update SpecInfo."""
-    content = filepath.read_text()
+def _parse_tasks(content: str, info: SpecInfo) -> None:
+    """Parse tasks.md content and update SpecInfo."""
 
     # Check for Per-Task Guardrail Checklist
     if "## Per-Task Guardrail Checklist" not in content:
@@ -339,9 +642,7 @@ def _parse_tasks(filepath: Path, info: SpecInfo) -> None:
         info.warnings.append("tasks.md: No tasks found")
 
     # Check for approval status
-    if re.search(r"Status:\s*Approved", content, re.IGNORECASE):
-        info.tasks_approved = True
-    elif re.search(r"\[x\]\s*Tasks approved", content, re.IGNORECASE):
+    if _is_approved(content, "tasks"):
         info.tasks_approved = True
 
 
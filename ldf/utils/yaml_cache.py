@@ -0,0 +1,30 @@
+"""Cached YAML file loading shared by LDF's config and guardrail loaders."""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Returns a deep copy, so callers may mutate the result without affecting the cache.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    stat = path.stat()
+    return copy.deepcopy(_load_yaml(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=64)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file. mtime_ns and size are part of the cache key so edits invalidate it."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
@@ -12,18 +12,23 @@ Usage:
 
 import os
 import re
-import uuid
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
+# Risk level line, e.g. "Risk Level: HIGH"
+_RISK_LEVEL_PATTERN = re.compile(r"Risk Level[:\s]*(CRITICAL|HIGH|MEDIUM|LOW)", re.IGNORECASE)
 
+# Issue rows in markdown tables: | ID | Title | Location | ...
+# Gap analysis format: | G-001 | ...
+# Edge cases format: | BC-001 |, | TC-001 |, | ST-001 |, | DC-001 |, | UB-001 |, | IC-001 |
+# The location cell is optional, so "| G-001 | Description |" rows still count.
+# Cells stay on one line and keep their padding (stripped later) so matching is linear
+_ISSUE_ROW_PATTERN = re.compile(r"\|[^\S\n]*(\w+-\d+)[^\S\n]*\|([^|\n]+)(?:\|([^|\n]*))?")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AuditIssue:
     """Single issue found during audit."""
 
@@ -35,7 +40,7 @@ class AuditIssue:
     recommendation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """Result of an audit request."""
 
@@ -69,10 +74,14 @@ class GeminiAuditor:
             max_tokens: Maximum response tokens.
             prompts_dir: Directory containing prompt files.
         """
-        if genai is None:
+        # Imported here so that importing this module (e.g. for AuditResult) stays cheap
+        try:
+            import google.generativeai as genai
+        except ImportError as e:
             raise ImportError(
                 "google-generativeai package not installed. Run: pip install google-generativeai"
-            )
+            ) from e
+        self._genai = genai
 
         # Support both GOOGLE_API_KEY (standard) and GOOGLE_AI_API_KEY (legacy)
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GOOGLE_AI_API_KEY")
@@ -115,7 +124,9 @@ class GeminiAuditor:
         Returns:
             AuditResult with findings.
         """
-        request_id = f"AUDIT-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:6].upper()}"
+        # One clock read serves both the request ID and the result timestamp
+        timestamp = datetime.now()
+        request_id = f"AUDIT-{timestamp:%Y%m%d}-{secrets.token_hex(3).upper()}"
 
         try:
             system_prompt = self._load_prompt(prompt_type)
@@ -127,7 +138,7 @@ class GeminiAuditor:
             # Gemini uses generate_content_async for async
             response = await self.model.generate_content_async(
                 full_prompt,
-                generation_config=genai.GenerationConfig(
+                generation_config=self._genai.GenerationConfig(
                     max_output_tokens=self.max_tokens,
                     temperature=0.3,
                 ),
@@ -139,6 +150,7 @@ class GeminiAuditor:
                 request_id=request_id,
                 audit_type=prompt_type,
                 raw_response=raw_response,
+                timestamp=timestamp,
             )
 
         except Exception as e:
@@ -146,7 +158,7 @@ class GeminiAuditor:
                 request_id=request_id,
                 audit_type=prompt_type,
                 agent="gemini",
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 assessment="ERROR",
                 risk_level="UNKNOWN",
                 raw_response="",
@@ -158,77 +170,70 @@ class GeminiAuditor:
         request_id: str,
         audit_type: str,
         raw_response: str,
+        timestamp: datetime,
     ) -> AuditResult:
         """Parse Gemini response into structured result."""
         issues = []
 
         # Extract assessment
+        upper_response = raw_response.upper()
         assessment = "NEEDS_REVISION"
-        if "APPROVE" in raw_response.upper() and "NEEDS_REVISION" not in raw_response.upper():
+        if "APPROVE" in upper_response and "NEEDS_REVISION" not in upper_response:
             assessment = "APPROVE"
-        elif "REJECT" in raw_response.upper():
+        elif "REJECT" in upper_response:
             assessment = "REJECT"
 
         # Extract risk level
         risk_level = "MEDIUM"
-        risk_match = re.search(
-            r"Risk Level[:\s]*(CRITICAL|HIGH|MEDIUM|LOW)", raw_response, re.IGNORECASE
-        )
+        risk_match = _RISK_LEVEL_PATTERN.search(raw_response)
         if risk_match:
             risk_level = risk_match.group(1).upper()
 
-        # Extract issues from markdown tables
-        # Gap analysis format: | G-001 | ...
-        # Edge cases format: | BC-001 |, | TC-001 |, | ST-001 |, | DC-001 |, | UB-001 |, | IC-001 |
-        issue_patterns = [
-            # Table format with various ID prefixes
-            r"\|\s*([GBTSDUI][C]?-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)",
-            # Generic table format
-            r"\|\s*(\w+-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)",
-        ]
-
-        for pattern in issue_patterns:
-            matches = re.findall(pattern, raw_response)
-            for match in matches:
-                if len(match) >= 2:
-                    issue_id = str(match[0]).strip()
-                    title = match[1].strip()
-                    location = match[2].strip() if len(match) > 2 else ""
-
-                    # Skip header rows
-                    if title.lower() in [
-                        "gap id",
-                        "id",
-                        "title",
-                        "user type",
-                        "scenario",
-                        "input/condition",
-                    ]:
-                        continue
-
-                    # Determine severity based on context or ID
-                    severity = "MEDIUM"
-                    if "critical" in title.lower() or "high risk" in title.lower():
-                        severity = "HIGH"
-                    elif "low" in title.lower():
-                        severity = "LOW"
-
-                    issues.append(
-                        AuditIssue(
-                            id=issue_id,
-                            severity=severity,
-                            title=title,
-                            location=location,
-                            description="",
-                            recommendation="",
-                        )
-                    )
+        # Extract issues from markdown tables, once per issue ID
+        seen_ids: set[str] = set()
+        for match in _ISSUE_ROW_PATTERN.finditer(raw_response):
+            issue_id = match.group(1).strip()
+            if issue_id in seen_ids:
+                continue
+            title = match.group(2).strip()
+            title_lower = title.lower()
+            location = (match.group(3) or "").strip()
+
+            # Skip header rows
+            if title_lower in [
+                "gap id",
+                "id",
+                "title",
+                "user type",
+                "scenario",
+                "input/condition",
+            ]:
+                continue
+
+            # Determine severity based on context or ID
+            severity = "MEDIUM"
+            if "critical" in title_lower or "high risk" in title_lower:
+                severity = "HIGH"
+            elif "low" in title_lower:
+                severity = "LOW"
+
+            seen_ids.add(issue_id)
+            issues.append(
+                AuditIssue(
+                    id=issue_id,
+                    severity=severity,
+                    title=title,
+                    location=location,
+                    description="",
+                    recommendation="",
+                )
+            )
 
         return AuditResult(
             request_id=request_id,
             audit_type=audit_type,
             agent="gemini",
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             assessment=assessment,
             risk_level=risk_level,
             issues=issues,
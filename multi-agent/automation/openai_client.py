@@ -6,24 +6,41 @@ Sends audit requests to ChatGPT API and parses responses.
 Usage:
     from multi_agent.automation.openai_client import ChatGPTAuditor
 
-    auditor = ChatGPTAuditor()
-    result = await auditor.audit_spec(spec_content, "spec-review")
+    async with ChatGPTAuditor() as auditor:
+        result = await auditor.audit_spec(spec_content, "spec-review")
+        results = await auditor.audit_batch([(spec_a, "spec-review"), (spec_b, "security-check")])
 """
 
+import asyncio
+import hashlib
 import os
 import re
-import uuid
-from dataclasses import dataclass, field
+import secrets
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 
-try:
-    from openai import AsyncOpenAI
-except ImportError:
-    AsyncOpenAI = None
+# Risk level line, e.g. "Risk Level: HIGH"
+_RISK_LEVEL_PATTERN = re.compile(r"Risk Level[:\s]*(CRITICAL|HIGH|MEDIUM|LOW)", re.IGNORECASE)
 
+# Issues, in either of two formats (one scan finds both):
+# - table row: | C-001 | Title | Location | ... (the location cell is optional)
+# - numbered list: 1. **Title**: location
+# Cells and titles stay on one line and carry their own padding (stripped later), so
+# no two adjacent quantifiers can trade characters. That keeps matching linear on
+# malformed model output; overlapping \s* and [^|]+ backtracked cubically.
+_ISSUE_PATTERN = re.compile(
+    r"\|[^\S\n]*(?P<table_id>[CHML]-\d+)[^\S\n]*"
+    r"\|(?P<table_title>[^|\n]+)(?:\|(?P<table_location>[^|\n]*))?"
+    r"|(?P<list_id>\d+)\.[^\S\n]*\*\*(?P<list_title>[^*\n]+)\*\*[:\s]*(?P<list_location>[^\n]+)?"
+)
 
-@dataclass
+# Severity named by a table issue ID prefix (C-001, H-002, M-003, L-004)
+_SEVERITY_BY_PREFIX = {"C": "CRITICAL", "H": "HIGH", "M": "MEDIUM", "L": "LOW"}
+
+
+@dataclass(slots=True, frozen=True)
 class AuditIssue:
     """Single issue found during audit."""
 
@@ -35,7 +52,7 @@ class AuditIssue:
     recommendation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """Result of an audit request."""
 
@@ -48,6 +65,7 @@ class AuditResult:
     issues: list[AuditIssue] = field(default_factory=list)
     raw_response: str = ""
     error: str | None = None
+    cached_prompt_tokens: int = 0  # Prompt tokens served from the API's prefix cache
 
 
 class ChatGPTAuditor:
@@ -59,6 +77,10 @@ class ChatGPTAuditor:
         model: str = "gpt-4o",
         max_tokens: int = 4000,
         prompts_dir: Path | None = None,
+        timeout: float | None = None,
+        max_connections: int = 100,
+        result_cache_size: int = 128,
+        max_concurrency: int = 10,
     ):
         """
         Initialize ChatGPT auditor.
@@ -68,15 +90,36 @@ class ChatGPTAuditor:
             model: Model to use. Defaults to gpt-4o.
             max_tokens: Maximum response tokens.
             prompts_dir: Directory containing prompt files.
+            timeout: Request timeout in seconds. Defaults to the SDK's own timeout.
+            max_connections: Connection pool size shared by concurrent audits.
+            result_cache_size: Number of audit results kept for repeated identical
+                requests. 0 disables the cache.
+            max_concurrency: Maximum audits in flight at once in audit_batch.
         """
-        if AsyncOpenAI is None:
-            raise ImportError("openai package not installed. Run: pip install openai")
+        # Imported here so that importing this module (e.g. for AuditResult) stays cheap
+        try:
+            import httpx
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+        except ImportError as e:
+            raise ImportError("openai package not installed. Run: pip install openai") from e
 
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY env var.")
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # One pooled HTTP client for all audits, so concurrent requests reuse
+        # connections (multiplexed over HTTP/2 when h2 is installed). The SDK's
+        # default client keeps its timeout and redirect settings.
+        limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        try:
+            http_client = DefaultAsyncHttpxClient(http2=True, limits=limits)
+        except ImportError:
+            http_client = DefaultAsyncHttpxClient(limits=limits)
+
+        client_kwargs = {} if timeout is None else {"timeout": timeout}
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=http_client, **client_kwargs)
         self.model = model
         self.max_tokens = max_tokens
 
@@ -85,12 +128,28 @@ class ChatGPTAuditor:
         else:
             self.prompts_dir = Path(__file__).parent.parent / "prompts" / "chatgpt"
 
+        # Successful results keyed by a digest of everything sent to the API
+        self.result_cache_size = result_cache_size
+        self._result_cache: OrderedDict[str, AuditResult] = OrderedDict()
+        self.max_concurrency = max_concurrency
+        # prompt_type -> (mtime_ns, content) of prompt files already read
+        self._prompt_cache: dict[str, tuple[int, str]] = {}
+
     def _load_prompt(self, prompt_type: str) -> str:
-        """Load prompt file content."""
+        """Load prompt file content, rereading only when the file has changed."""
         prompt_file = self.prompts_dir / f"{prompt_type}.md"
-        if not prompt_file.exists():
-            raise ValueError(f"Prompt file not found: {prompt_file}")
-        return prompt_file.read_text()
+        try:
+            mtime_ns = prompt_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise ValueError(f"Prompt file not found: {prompt_file}") from None
+
+        cached = self._prompt_cache.get(prompt_type)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        content = prompt_file.read_text()
+        self._prompt_cache[prompt_type] = (mtime_ns, content)
+        return content
 
     async def audit_spec(
         self,
@@ -107,18 +166,40 @@ class ChatGPTAuditor:
             context: Additional context to include.
 
         Returns:
-            AuditResult with findings.
+            AuditResult with findings. An identical earlier request (same model,
+            prompt and content) returns the earlier result under a new request ID.
         """
-        request_id = f"AUDIT-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:6].upper()}"
+        # One clock read serves both the request ID and the result timestamp
+        timestamp = datetime.now()
+        request_id = f"AUDIT-{timestamp:%Y%m%d}-{secrets.token_hex(3).upper()}"
 
         try:
             system_prompt = self._load_prompt(prompt_type)
 
+            # The system prompt goes first and is sent exactly as read from disk, so
+            # repeated audits share a prefix that OpenAI's automatic prompt caching reuses.
+            # Anything per-request (context, spec) belongs in the user message.
             user_message = f"## Audit Request\n\n{spec_content}"
             if context:
                 user_message = f"## Context\n\n{context}\n\n{user_message}"
 
-            response = await self.client.chat.completions.create(
+            cache_key = self._result_cache_key(system_prompt, user_message)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                # Nothing was sent, so no prompt tokens were used
+                return replace(
+                    cached,
+                    request_id=request_id,
+                    timestamp=timestamp,
+                    issues=list(cached.issues),
+                    cached_prompt_tokens=0,
+                )
+
+            # Stream the completion so long audits arrive incrementally instead of
+            # in one response held back until generation ends (and the read timeout
+            # applies between chunks rather than to the whole completion)
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -126,94 +207,156 @@ class ChatGPTAuditor:
                 ],
                 max_tokens=self.max_tokens,
                 temperature=0.3,  # Lower temperature for consistency
+                stream=True,
+                stream_options={"include_usage": True},
             )
 
-            raw_response = response.choices[0].message.content or ""
+            parts: list[str] = []
+            usage = None
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                if chunk.usage is not None:
+                    usage = chunk.usage  # Sent in the final chunk
+            raw_response = "".join(parts)
 
-            return self._parse_response(
+            result = self._parse_response(
                 request_id=request_id,
                 audit_type=prompt_type,
                 raw_response=raw_response,
+                timestamp=timestamp,
             )
+            details = getattr(usage, "prompt_tokens_details", None)
+            result.cached_prompt_tokens = getattr(details, "cached_tokens", None) or 0
+
+            if self.result_cache_size > 0:
+                self._result_cache[cache_key] = result
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+            return result
 
         except Exception as e:
             return AuditResult(
                 request_id=request_id,
                 audit_type=prompt_type,
                 agent="chatgpt",
-                timestamp=datetime.now(),
+                timestamp=timestamp,
                 assessment="ERROR",
                 risk_level="UNKNOWN",
                 raw_response="",
                 error=str(e),
             )
 
+    async def audit_batch(
+        self,
+        items: list[tuple[str, str]],
+        context: str | None = None,
+    ) -> list[AuditResult]:
+        """
+        Run several audits concurrently.
+
+        Args:
+            items: (spec_content, prompt_type) pairs to audit.
+            context: Additional context to include in every audit.
+
+        Returns:
+            AuditResults in the same order as items.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def audit_one(spec_content: str, prompt_type: str) -> AuditResult:
+            async with semaphore:
+                return await self.audit_spec(spec_content, prompt_type, context)
+
+        return list(
+            await asyncio.gather(
+                *(audit_one(spec_content, prompt_type) for spec_content, prompt_type in items)
+            )
+        )
+
+    def _result_cache_key(self, system_prompt: str, user_message: str) -> str:
+        """Digest of the request parameters that determine the audit result."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model, str(self.max_tokens), system_prompt, user_message):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def _parse_response(
         self,
         request_id: str,
         audit_type: str,
         raw_response: str,
+        timestamp: datetime,
     ) -> AuditResult:
         """Parse ChatGPT response into structured result."""
+        # Nothing to scan; these are the defaults parsing would fall back to
+        if not raw_response:
+            return AuditResult(
+                request_id=request_id,
+                audit_type=audit_type,
+                agent="chatgpt",
+                timestamp=timestamp,
+                assessment="NEEDS_REVISION",
+                risk_level="MEDIUM",
+            )
+
         issues = []
 
         # Extract assessment
+        upper_response = raw_response.upper()
         assessment = "NEEDS_REVISION"
-        if "APPROVE" in raw_response.upper() and "NEEDS_REVISION" not in raw_response.upper():
+        if "APPROVE" in upper_response and "NEEDS_REVISION" not in upper_response:
             assessment = "APPROVE"
-        elif "REJECT" in raw_response.upper():
+        elif "REJECT" in upper_response:
             assessment = "REJECT"
 
         # Extract risk level
         risk_level = "MEDIUM"
-        risk_match = re.search(
-            r"Risk Level[:\s]*(CRITICAL|HIGH|MEDIUM|LOW)", raw_response, re.IGNORECASE
-        )
+        risk_match = _RISK_LEVEL_PATTERN.search(raw_response)
         if risk_match:
             risk_level = risk_match.group(1).upper()
 
-        # Extract issues from markdown tables or lists
-        # Look for patterns like "| C-001 |" or "1. **Issue Title**"
-        issue_patterns = [
-            # Table format: | ID | Title | Location | ...
-            r"\|\s*([CHML]-\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)",
-            # List format: 1. **Title** or 1. [Title]
-            r"(\d+)\.\s*\*\*([^*]+)\*\*[:\s]*([^\n]+)?",
-        ]
-
-        for pattern in issue_patterns:
-            matches = re.findall(pattern, raw_response)
-            for match in matches:
-                if len(match) >= 2:
-                    issue_id = str(match[0])
-                    title = match[1].strip()
-                    location = match[2].strip() if len(match) > 2 else ""
-
-                    # Determine severity from ID prefix
+        # Extract issues from markdown tables or lists, in document order
+        for match in _ISSUE_PATTERN.finditer(raw_response):
+            if match.group("table_id") is not None:
+                issue_id = match.group("table_id")
+                title = match.group("table_title").strip()
+                location = (match.group("table_location") or "").strip()
+            else:
+                issue_id = match.group("list_id")
+                title = match.group("list_title").strip()
+                location = (match.group("list_location") or "").strip()
+
+            # Determine severity from ID prefix, or from title keywords for numbered items
+            severity = _SEVERITY_BY_PREFIX.get(issue_id[:1])
+            if severity is None:
+                title_lower = title.lower()
+                if "critical" in title_lower:
+                    severity = "CRITICAL"
+                elif "high" in title_lower:
+                    severity = "HIGH"
+                elif "low" in title_lower:
+                    severity = "LOW"
+                else:
                     severity = "MEDIUM"
-                    if issue_id.startswith("C") or "critical" in title.lower():
-                        severity = "CRITICAL"
-                    elif issue_id.startswith("H") or "high" in title.lower():
-                        severity = "HIGH"
-                    elif issue_id.startswith("L") or "low" in title.lower():
-                        severity = "LOW"
-
-                    issues.append(
-                        AuditIssue(
-                            id=issue_id,
-                            severity=severity,
-                            title=title,
-                            location=location,
-                            description="",  # Would need more parsing
-                            recommendation="",
-                        )
-                    )
+
+            issues.append(
+                AuditIssue(
+                    id=issue_id,
+                    severity=severity,
+                    title=title,
+                    location=location,
+                    description="",  # Would need more parsing
+                    recommendation="",
+                )
+            )
 
         return AuditResult(
             request_id=request_id,
             audit_type=audit_type,
             agent="chatgpt",
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             assessment=assessment,
             risk_level=risk_level,
             issues=issues,
@@ -222,4 +365,11 @@ class ChatGPTAuditor:
 
     async def close(self):
         """Close the client (for cleanup)."""
+        # Also closes the pooled HTTP client handed to it
         await self.client.close()
+
+    async def __aenter__(self) -> "ChatGPTAuditor":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
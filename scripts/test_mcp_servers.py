@@ -12,11 +12,24 @@ Usage:
 """
 
 import argparse
+import ast
 import importlib.util
+import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
+# Results of .py file checks, reused while a file's mtime and size are unchanged.
+# Bump the version whenever the checks or their messages change. Whether a file
+# compiles depends on the Python running the checks, so results are only reused
+# by the same interpreter.
+CHECK_CACHE_PATH = Path(".agent") / ".mcp_validate_cache.json"
+CHECK_CACHE_VERSION = 1
+CHECK_CACHE_INTERPRETER = [sys.executable, list(sys.version_info)]
+
+CheckCache = dict[str, dict[str, Any]]
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -40,178 +53,231 @@ def load_module(path: Path, module_name: str) -> Any:
     return module
 
 
-def check_file_exists(path: Path, name: str) -> tuple[bool, str]:
-    """Check if file exists and is non-empty."""
-    if not path.exists():
-        return False, f"{name}: File not found at {path}"
-    if path.stat().st_size == 0:
-        return False, f"{name}: File is empty"
-    return True, f"{name}: Found ({path.stat().st_size} bytes)"
-
+def check_python_syntax(
+    code: str, path: Path, name: str
+) -> tuple[tuple[bool, str], ast.Module | None]:
+    """Check Python source for syntax errors.
 
-def check_python_syntax(path: Path, name: str) -> tuple[bool, str]:
-    """Check Python file for syntax errors."""
+    Returns:
+        The check result and the parsed module (None on syntax errors), so later
+        checks can inspect the tree without parsing again.
+    """
     try:
-        with open(path, encoding="utf-8", errors="replace") as f:
-            code = f.read()
-        compile(code, path, "exec")
-        return True, f"{name}: Syntax OK"
+        tree = ast.parse(code, filename=str(path))
+        # Compiling the tree also catches errors ast.parse allows (e.g. return outside def)
+        compile(tree, path, "exec")
+        return (True, f"{name}: Syntax OK"), tree
     except SyntaxError as e:
-        return False, f"{name}: Syntax error at line {e.lineno}: {e.msg}"
-    except UnicodeDecodeError as e:
-        return False, f"{name}: Encoding error: {e}"
+        return (False, f"{name}: Syntax error at line {e.lineno}: {e.msg}"), None
 
 
-def check_imports(path: Path, name: str) -> tuple[bool, str]:
-    """Check that required imports are present in the file."""
-    try:
-        with open(path, encoding="utf-8", errors="replace") as f:
-            content = f.read()
+def check_imports(content: str, name: str) -> tuple[bool, str]:
+    """Check that required imports are present in the source."""
+    required = ["from mcp.server import Server", "from mcp import types"]
+    missing = [imp for imp in required if imp not in content]
+
+    if missing:
+        return False, f"{name}: Missing imports: {missing}"
+    return True, f"{name}: Required imports present"
 
-        required = ["from mcp.server import Server", "from mcp import types"]
-        missing = [imp for imp in required if imp not in content]
 
-        if missing:
-            return False, f"{name}: Missing imports: {missing}"
-        return True, f"{name}: Required imports present"
-    except Exception as e:
-        return False, f"{name}: Error checking imports: {e}"
+def _is_attribute_call(node: ast.AST, owner: str, attr: str) -> bool:
+    """Check whether node is a call of the form owner.attr(...)."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == attr
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == owner
+    )
 
 
-def check_tool_definitions(path: Path, name: str) -> tuple[bool, str]:
-    """Check that tools are properly defined."""
-    try:
-        with open(path, encoding="utf-8", errors="replace") as f:
-            content = f.read()
+def check_tool_definitions(tree: ast.Module, name: str) -> tuple[bool, str]:
+    """Check that tools are properly defined.
 
-        # Check for list_tools decorator
-        if "@app.list_tools()" not in content:
-            return False, f"{name}: Missing @app.list_tools() decorator"
+    Works on the syntax tree, so commented-out code and strings don't count.
+    """
+    decorators = set()
+    tool_count = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                for hook in ("list_tools", "call_tool"):
+                    if _is_attribute_call(decorator, "app", hook):
+                        decorators.add(hook)
+        elif _is_attribute_call(node, "types", "Tool"):
+            tool_count += 1
 
-        # Check for call_tool decorator
-        if "@app.call_tool()" not in content:
-            return False, f"{name}: Missing @app.call_tool() decorator"
+    # Check for list_tools decorator
+    if "list_tools" not in decorators:
+        return False, f"{name}: Missing @app.list_tools() decorator"
 
-        # Count types.Tool definitions
-        tool_count = content.count("types.Tool(")
-        if tool_count == 0:
-            return False, f"{name}: No tools defined"
+    # Check for call_tool decorator
+    if "call_tool" not in decorators:
+        return False, f"{name}: Missing @app.call_tool() decorator"
 
-        return True, f"{name}: Found {tool_count} tool definitions"
-    except Exception as e:
-        return False, f"{name}: Error checking tools: {e}"
+    # Count types.Tool definitions
+    if tool_count == 0:
+        return False, f"{name}: No tools defined"
 
+    return True, f"{name}: Found {tool_count} tool definitions"
 
-def validate_spec_inspector(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool, str]]:
-    """Validate spec_inspector MCP server."""
-    results = []
-    server_dir = mcp_dir / "spec_inspector"
-
-    # Check required files
-    files = [
-        ("server.py", server_dir / "server.py"),
-        ("spec_parser.py", server_dir / "spec_parser.py"),
-        ("guardrail_tracker.py", server_dir / "guardrail_tracker.py"),
-        ("requirements.txt", server_dir / "requirements.txt"),
-        ("README.md", server_dir / "README.md"),
-    ]
-
-    for name, path in files:
-        results.append(check_file_exists(path, name))
-
-    # Check Python syntax
-    python_files = [f for f in files if f[0].endswith(".py")]
-    for name, path in python_files:
-        if path.exists():
-            results.append(check_python_syntax(path, name))
-
-    # Check server.py specifics
-    server_path = server_dir / "server.py"
-    if server_path.exists():
-        results.append(check_imports(server_path, "server.py"))
-        results.append(check_tool_definitions(server_path, "server.py"))
 
+def read_file(path: Path, name: str) -> tuple[bytes | None, tuple[bool, str]]:
+    """Read a file and check that it exists and is non-empty.
+
+    Returns:
+        The file contents (None if unreadable) and the existence check result.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, (False, f"{name}: File not found at {path}")
+    except OSError as e:
+        return None, (False, f"{name}: Cannot read file: {e}")
+
+    if not data:
+        return data, (False, f"{name}: File is empty")
+    return data, (True, f"{name}: Found ({len(data)} bytes)")
+
+
+def inspect_file(
+    path: Path, name: str, is_server: bool = False, cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
+    """Run all checks for one file from a single read.
+
+    Every file must exist and be non-empty. Python files must also compile, and
+    server files must have the MCP imports and tool definitions. With a cache,
+    results for an unchanged .py file are reused instead of compiling it again.
+    """
+    stamp = None
+    if cache is not None and name.endswith(".py"):
+        try:
+            stat = path.stat()
+        except OSError:
+            pass  # Reported as missing or unreadable below
+        else:
+            stamp = [stat.st_mtime_ns, stat.st_size, name, is_server]
+            entry = cache.get(str(path))
+            if entry is not None and entry["stamp"] == stamp:
+                return [(success, message) for success, message in entry["results"]]
+
+    data, exists_result = read_file(path, name)
+    results = [exists_result]
+    if data and name.endswith(".py"):
+        content = data.decode("utf-8", errors="replace")
+        syntax_result, tree = check_python_syntax(content, path, name)
+        results.append(syntax_result)
+        if is_server:
+            results.append(check_imports(content, name))
+            if tree is not None:
+                results.append(check_tool_definitions(tree, name))
+
+    if cache is not None and stamp is not None:
+        cache[str(path)] = {"stamp": stamp, "results": results}
     return results
 
 
-def validate_coverage_reporter(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool, str]]:
-    """Validate coverage_reporter MCP server."""
+def load_check_cache(cache_path: Path) -> CheckCache:
+    """Load cached check results, or an empty cache if missing or outdated."""
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CHECK_CACHE_VERSION
+        or data.get("interpreter") != CHECK_CACHE_INTERPRETER
+    ):
+        return {}
+    files: CheckCache = data.get("files", {})
+    return files
+
+
+def save_check_cache(cache_path: Path, cache: CheckCache) -> None:
+    """Write cached check results atomically; failures only cost the cache."""
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "version": CHECK_CACHE_VERSION,
+                    "interpreter": CHECK_CACHE_INTERPRETER,
+                    "files": cache,
+                }
+            )
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def validate_server_files(
+    server_dir: Path, filenames: list[str], cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
+    """Check the files of one MCP server; server.py gets the MCP-specific checks."""
     results = []
-    server_dir = mcp_dir / "coverage_reporter"
-
-    # Check required files
-    files = [
-        ("server.py", server_dir / "server.py"),
-        ("coverage_parser.py", server_dir / "coverage_parser.py"),
-        ("guardrail_validator.py", server_dir / "guardrail_validator.py"),
-        ("requirements.txt", server_dir / "requirements.txt"),
-        ("README.md", server_dir / "README.md"),
-    ]
-
-    for name, path in files:
-        results.append(check_file_exists(path, name))
-
-    # Check Python syntax
-    python_files = [f for f in files if f[0].endswith(".py")]
-    for name, path in python_files:
-        if path.exists():
-            results.append(check_python_syntax(path, name))
-
-    # Check server.py specifics
-    server_path = server_dir / "server.py"
-    if server_path.exists():
-        results.append(check_imports(server_path, "server.py"))
-        results.append(check_tool_definitions(server_path, "server.py"))
-
+    for filename in filenames:
+        is_server = Path(filename).name == "server.py"
+        results.extend(inspect_file(server_dir / filename, filename, is_server, cache))
     return results
 
 
-def validate_db_inspector_template(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool, str]]:
-    """Validate db_inspector template (optional server)."""
-    results = []
-    server_dir = mcp_dir / "db_inspector"
-    template_dir = server_dir / "template"
-
-    # Check main README
-    results.append(check_file_exists(server_dir / "README.md", "README.md"))
-
-    # Check template files
-    files = [
-        ("template/server.py", template_dir / "server.py"),
-        ("template/schema_query.py", template_dir / "schema_query.py"),
-        ("template/requirements.txt", template_dir / "requirements.txt"),
-    ]
-
-    for name, path in files:
-        results.append(check_file_exists(path, name))
-
-    # Check Python syntax
-    python_files = [f for f in files if f[0].endswith(".py")]
-    for name, path in python_files:
-        if path.exists():
-            results.append(check_python_syntax(path, name))
-
-    # Check server.py specifics
-    server_path = template_dir / "server.py"
-    if server_path.exists():
-        results.append(check_imports(server_path, "template/server.py"))
-        results.append(check_tool_definitions(server_path, "template/server.py"))
+def validate_spec_inspector(
+    mcp_dir: Path, verbose: bool = False, cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
+    """Validate spec_inspector MCP server."""
+    return validate_server_files(
+        mcp_dir / "spec_inspector",
+        ["server.py", "spec_parser.py", "guardrail_tracker.py", "requirements.txt", "README.md"],
+        cache,
+    )
+
+
+def validate_coverage_reporter(
+    mcp_dir: Path, verbose: bool = False, cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
+    """Validate coverage_reporter MCP server."""
+    return validate_server_files(
+        mcp_dir / "coverage_reporter",
+        [
+            "server.py",
+            "coverage_parser.py",
+            "guardrail_validator.py",
+            "requirements.txt",
+            "README.md",
+        ],
+        cache,
+    )
 
-    return results
+
+def validate_db_inspector_template(
+    mcp_dir: Path, verbose: bool = False, cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
+    """Validate db_inspector template (optional server)."""
+    return validate_server_files(
+        mcp_dir / "db_inspector",
+        [
+            "README.md",
+            "template/server.py",
+            "template/schema_query.py",
+            "template/requirements.txt",
+        ],
+        cache,
+    )
 
 
-def validate_mcp_setup(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool, str]]:
+def validate_mcp_setup(
+    mcp_dir: Path, verbose: bool = False, cache: CheckCache | None = None
+) -> list[tuple[bool, str]]:
     """Validate MCP_SETUP.md documentation."""
-    results = []
     setup_path = mcp_dir / "MCP_SETUP.md"
 
-    results.append(check_file_exists(setup_path, "MCP_SETUP.md"))
-
-    if setup_path.exists():
-        with open(setup_path, encoding="utf-8", errors="replace") as f:
-            content = f.read()
+    data, exists_result = read_file(setup_path, "MCP_SETUP.md")
+    results = [exists_result]
 
-        # Check for required sections
+    if data is not None:
+        # Check for required sections (plain substring tests on the raw bytes; no decode)
         sections = [
             "## Prerequisites",
             "## Quick Setup",
@@ -221,7 +287,7 @@ def validate_mcp_setup(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool,
         ]
 
         for section in sections:
-            if section in content:
+            if section.encode() in data:
                 results.append((True, f"MCP_SETUP.md: Contains '{section}'"))
             else:
                 results.append((False, f"MCP_SETUP.md: Missing '{section}'"))
@@ -229,6 +295,15 @@ def validate_mcp_setup(mcp_dir: Path, verbose: bool = False) -> list[tuple[bool,
     return results
 
 
+# Validator for each --server choice ("setup" covers MCP_SETUP.md)
+VALIDATORS = {
+    "spec_inspector": validate_spec_inspector,
+    "coverage_reporter": validate_coverage_reporter,
+    "db_inspector": validate_db_inspector_template,
+    "setup": validate_mcp_setup,
+}
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Validate MCP server structure")
@@ -250,6 +325,11 @@ def main():
         default=None,
         help="Path to mcp-servers directory",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Recheck every file instead of reusing results from {CHECK_CACHE_PATH}",
+    )
     args = parser.parse_args()
 
     # Find MCP servers directory
@@ -278,21 +358,16 @@ def main():
     else:
         servers_to_check = [args.server]
 
-    # Run validations
+    # The cache lives in the project's .agent/ directory; without one, nothing is cached
+    use_cache = not args.no_cache and CHECK_CACHE_PATH.parent.is_dir()
+    cache = load_check_cache(CHECK_CACHE_PATH) if use_cache else None
+
+    # Run validations (serially: the whole run takes a fraction of a second, less
+    # than starting worker processes would)
     for server in servers_to_check:
         print(f"{Colors.BLUE}Checking {server}...{Colors.RESET}")
 
-        if server == "spec_inspector":
-            results = validate_spec_inspector(mcp_dir, args.verbose)
-        elif server == "coverage_reporter":
-            results = validate_coverage_reporter(mcp_dir, args.verbose)
-        elif server == "db_inspector":
-            results = validate_db_inspector_template(mcp_dir, args.verbose)
-        elif server == "setup":
-            results = validate_mcp_setup(mcp_dir, args.verbose)
-        else:
-            continue
-
+        results = VALIDATORS[server](mcp_dir, args.verbose, cache)
         all_results.extend(results)
 
         # Display results
@@ -304,6 +379,9 @@ def main():
 
         print()
 
+    if cache is not None:
+        save_check_cache(CHECK_CACHE_PATH, cache)
+
     # Summary
     passed = sum(1 for success, _ in all_results if success)
     failed = sum(1 for success, _ in all_results if not success)
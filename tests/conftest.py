@@ -1,5 +1,7 @@
 """Pytest configuration and fixtures for LDF tests."""
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -50,6 +52,33 @@ extends: core
     return project_dir
 
 
+@pytest.fixture(scope="session")
+def _initialized_project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run `ldf init --yes` once per session; initialized_project copies the result."""
+    from click.testing import CliRunner
+
+    from ldf.cli import main as cli
+
+    project_dir = tmp_path_factory.mktemp("ldf_template") / "test_project"
+    project_dir.mkdir()
+    original_cwd = os.getcwd()
+    os.chdir(project_dir)
+    try:
+        result = CliRunner().invoke(cli, ["init", "--yes"])
+    finally:
+        os.chdir(original_cwd)
+    assert result.exit_code == 0, result.output
+    return project_dir
+
+
+@pytest.fixture
+def initialized_project(_initialized_project_template: Path, tmp_path: Path) -> Path:
+    """Create a project as left by `ldf init --yes`, copied from a per-session template."""
+    project_dir = tmp_path / "test_project"
+    shutil.copytree(_initialized_project_template, project_dir)
+    return project_dir
+
+
 @pytest.fixture
 def temp_spec(temp_project: Path) -> Path:
     """Create a temporary spec directory with all three phases."""
@@ -113,6 +113,13 @@ class TestResolveEnvVar:
         result = _resolve_env_var("")
         assert result == ""
 
+    def test_resolve_env_var_multiple_and_unterminated(self, monkeypatch):
+        """Test several references resolve and an unterminated one is kept."""
+        monkeypatch.setenv("HOST", "example.com")
+        monkeypatch.setenv("PORT", "${HOST}")
+        result = _resolve_env_var("${HOST}:${PORT}/${}/${PATH_")
+        assert result == "example.com:${HOST}/${}/${PATH_"
+
 
 class TestLoadApiConfig:
     """Tests for loading API configuration."""
@@ -212,6 +219,26 @@ audit_api:
         configs = load_api_config(tmp_path)
         assert "chatgpt" not in configs
 
+    def test_load_api_config_resolves_env_after_caching(self, tmp_path, monkeypatch):
+        """Test env var changes apply while the parsed config is cached."""
+        ldf_dir = tmp_path / ".ldf"
+        ldf_dir.mkdir()
+        config_file = ldf_dir / "config.yaml"
+        config_file.write_text("""
+audit_api:
+  chatgpt:
+    api_key: ${OPENAI_API_KEY}
+""")
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-first")
+        assert load_api_config(tmp_path)["chatgpt"].api_key == "sk-first"
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-second")
+        assert load_api_config(tmp_path)["chatgpt"].api_key == "sk-second"
+
+        config_file.write_text("audit_api: {}\n# edited\n")
+        assert load_api_config(tmp_path) == {}
+
 
 class TestGetAuditor:
     """Tests for getting auditor instances."""
@@ -795,6 +822,23 @@ class TestSaveAuditResponseEdgeCases:
         assert saved_path.exists()
         assert (ldf_dir / "audit-history").exists()
 
+    def test_save_audit_response_writes_utf8(self, tmp_path):
+        """Test save_audit_response encodes large non-ASCII content as UTF-8."""
+        (tmp_path / ".ldf").mkdir()
+        body = "Résumé — naïve café ✓\n" * 20000
+
+        response = AuditResponse(
+            success=True,
+            provider="gemini",
+            audit_type="full",
+            spec_name=None,
+            content=body,
+            timestamp="2024-01-15T10:00:00",
+        )
+
+        saved_path = save_audit_response(response, tmp_path)
+        assert body in saved_path.read_bytes().decode("utf-8")
+
 
 class TestSaveAuditResponseSecurity:
     """Security tests for path traversal prevention in save_audit_response."""
@@ -9,12 +9,19 @@ from ldf import __version__
 from ldf.cli import main as cli
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
-    """Create a Click CLI test runner."""
+    """Create a Click CLI test runner (stateless between invokes, so shared)."""
     return CliRunner()
 
 
+@pytest.fixture
+def git_project(temp_project: Path) -> Path:
+    """Create a temp project that is also a git repository."""
+    (temp_project / ".git").mkdir()
+    return temp_project
+
+
 class TestCLIHelp:
     """Tests for CLI help and version commands."""
 
@@ -57,17 +64,17 @@ class TestInitCommand:
             config = Path(".ldf/config.yaml").read_text()
             assert "saas" in config or "preset" in config
 
-    def test_init_already_initialized(self, runner: CliRunner, tmp_path: Path):
+    def test_init_already_initialized(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test init when already initialized."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # First init
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            # Second init in non-interactive mode should succeed (overwrites)
-            result = runner.invoke(cli, ["init", "--yes"])
+        # Second init in non-interactive mode should succeed (overwrites)
+        result = runner.invoke(cli, ["init", "--yes"])
 
-            # Should succeed in non-interactive mode
-            assert result.exit_code == 0
+        # Should succeed in non-interactive mode
+        assert result.exit_code == 0
 
 
 class TestLintCommand:
@@ -228,45 +235,28 @@ class TestHooksCommands:
         # Should fail without git
         assert result.exit_code == 1
 
-    def test_hooks_install_success(self, runner: CliRunner, temp_project: Path, monkeypatch):
-        """Test hooks install succeeds with git."""
-        # Create .git directory
-        (temp_project / ".git").mkdir()
-        monkeypatch.chdir(temp_project)
-
-        result = runner.invoke(cli, ["hooks", "install", "-y", "--no-detect"])
-
-        assert result.exit_code == 0
-
-    def test_hooks_uninstall_not_installed(
-        self, runner: CliRunner, temp_project: Path, monkeypatch
-    ):
+    def test_hooks_uninstall_not_installed(self, runner: CliRunner, git_project: Path, monkeypatch):
         """Test hooks uninstall when not installed."""
-        (temp_project / ".git").mkdir()
-        monkeypatch.chdir(temp_project)
+        monkeypatch.chdir(git_project)
 
         result = runner.invoke(cli, ["hooks", "uninstall"])
 
         # Should fail when no hook installed
         assert result.exit_code == 1
 
-    def test_hooks_uninstall_success(self, runner: CliRunner, temp_project: Path, monkeypatch):
-        """Test hooks uninstall after install."""
-        (temp_project / ".git").mkdir()
-        monkeypatch.chdir(temp_project)
+    def test_hooks_install_then_uninstall(self, runner: CliRunner, git_project: Path, monkeypatch):
+        """Test hooks install succeeds with git and can then be uninstalled."""
+        monkeypatch.chdir(git_project)
 
-        # First install
-        runner.invoke(cli, ["hooks", "install", "-y", "--no-detect"])
+        install_result = runner.invoke(cli, ["hooks", "install", "-y", "--no-detect"])
+        assert install_result.exit_code == 0
 
-        # Then uninstall
         result = runner.invoke(cli, ["hooks", "uninstall"])
-
         assert result.exit_code == 0
 
-    def test_hooks_status(self, runner: CliRunner, temp_project: Path, monkeypatch):
+    def test_hooks_status(self, runner: CliRunner, git_project: Path, monkeypatch):
         """Test hooks status command."""
-        (temp_project / ".git").mkdir()
-        monkeypatch.chdir(temp_project)
+        monkeypatch.chdir(git_project)
 
         result = runner.invoke(cli, ["hooks", "status"])
 
@@ -285,27 +275,26 @@ class TestStatusCommand:
             assert result.exit_code == 0
             assert "NEW" in result.output or "new" in result.output.lower()
 
-    def test_status_initialized_project(self, runner: CliRunner, tmp_path: Path):
+    def test_status_initialized_project(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test status on an initialized project."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Initialize first
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            result = runner.invoke(cli, ["status"])
+        result = runner.invoke(cli, ["status"])
 
-            assert result.exit_code == 0
-            assert "CURRENT" in result.output or "Project" in result.output
+        assert result.exit_code == 0
+        assert "CURRENT" in result.output or "Project" in result.output
 
-    def test_status_json_output(self, runner: CliRunner, tmp_path: Path):
+    def test_status_json_output(self, runner: CliRunner, initialized_project: Path, monkeypatch):
         """Test status with JSON output."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            result = runner.invoke(cli, ["status", "--format", "json"])
+        result = runner.invoke(cli, ["status", "--format", "json"])
 
-            assert result.exit_code == 0
-            # Should contain JSON-like output
-            assert "{" in result.output or "state" in result.output.lower()
+        assert result.exit_code == 0
+        # Should contain JSON-like output
+        assert "{" in result.output or "state" in result.output.lower()
 
     def test_status_with_specs(self, runner: CliRunner, temp_spec: Path, monkeypatch):
         """Test status shows specs when present."""
@@ -417,27 +406,26 @@ class TestInitEdgeCases:
             # Should proceed with full init or show message
             assert result.exit_code == 0
 
-    def test_init_with_force(self, runner: CliRunner, tmp_path: Path):
+    def test_init_with_force(self, runner: CliRunner, initialized_project: Path, monkeypatch):
         """Test init --force reinitializes."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # First init
-            runner.invoke(cli, ["init", "--yes"])
-            # Force reinit
-            result = runner.invoke(cli, ["init", "--force", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            assert result.exit_code == 0
+        # Force reinit
+        result = runner.invoke(cli, ["init", "--force", "--yes"])
+
+        assert result.exit_code == 0
 
-    def test_init_repair_complete_project(self, runner: CliRunner, tmp_path: Path):
+    def test_init_repair_complete_project(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test init --repair on complete project."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Initialize fully
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            # Try repair - should say up to date or no repair needed
-            result = runner.invoke(cli, ["init", "--repair"])
+        # Try repair - should say up to date or no repair needed
+        result = runner.invoke(cli, ["init", "--repair"])
 
-            assert result.exit_code == 0
-            assert "up to date" in result.output.lower() or "complete" in result.output.lower()
+        assert result.exit_code == 0
+        assert "up to date" in result.output.lower() or "complete" in result.output.lower()
 
     def test_init_outdated_project(self, runner: CliRunner, tmp_path: Path):
         """Test init on outdated project shows update message."""
@@ -639,14 +627,14 @@ class TestConvertImportCommand:
             assert result.exit_code == 1
             assert "init" in result.output.lower()
 
-    def test_convert_import_dry_run(self, runner: CliRunner, tmp_path: Path):
+    def test_convert_import_dry_run(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test convert import with dry-run."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Initialize LDF first
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            # Create a response file
-            Path("response.md").write_text("""# Requirements
+        # Create a response file
+        Path("response.md").write_text("""# Requirements
 
 ## Feature: Test Feature
 
@@ -662,22 +650,23 @@ Design details here.
 - Task 2
 """)
 
-            result = runner.invoke(cli, ["convert", "import", "response.md", "--dry-run"])
+        result = runner.invoke(cli, ["convert", "import", "response.md", "--dry-run"])
 
-            # Should succeed or show preview
-            assert "dry run" in result.output.lower() or result.exit_code in (0, 1)
+        # Should succeed or show preview
+        assert "dry run" in result.output.lower() or result.exit_code in (0, 1)
 
-    def test_convert_import_with_spec_name(self, runner: CliRunner, tmp_path: Path):
+    def test_convert_import_with_spec_name(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test convert import with custom spec name."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            runner.invoke(cli, ["init", "--yes"])
+        monkeypatch.chdir(initialized_project)
 
-            Path("response.md").write_text("# Requirements\n\nTest content")
+        Path("response.md").write_text("# Requirements\n\nTest content")
 
-            result = runner.invoke(cli, ["convert", "import", "response.md", "-n", "my-feature"])
+        result = runner.invoke(cli, ["convert", "import", "response.md", "-n", "my-feature"])
 
-            # Check it ran (may fail on parsing but command executed)
-            assert result.exit_code in (0, 1)
+        # Check it ran (may fail on parsing but command executed)
+        assert result.exit_code in (0, 1)
 
 
 class TestStatusEdgeCases:
@@ -730,26 +719,24 @@ class TestStatusEdgeCases:
                 # Should show invalid files in output
                 assert "Invalid" in result.output or "invalid" in result.output.lower()
 
-    def test_status_with_many_specs(self, runner: CliRunner, tmp_path: Path):
+    def test_status_with_many_specs(
+        self, runner: CliRunner, initialized_project: Path, monkeypatch
+    ):
         """Test status shows >5 specs with 'and X more' message."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Initialize LDF
-            runner.invoke(cli, ["init", "--yes"])
-
-            # Create more than 5 specs
-            specs_dir = Path(".ldf/specs")
-            for i in range(8):
-                spec_dir = specs_dir / f"spec-{i}"
-                spec_dir.mkdir(parents=True, exist_ok=True)
-                (spec_dir / "requirements.md").write_text(
-                    f"# Spec {i}\n\nRequirements for spec {i}"
-                )
+        monkeypatch.chdir(initialized_project)
 
-            result = runner.invoke(cli, ["status"])
+        # Create more than 5 specs
+        specs_dir = Path(".ldf/specs")
+        for i in range(8):
+            spec_dir = specs_dir / f"spec-{i}"
+            spec_dir.mkdir(parents=True, exist_ok=True)
+            (spec_dir / "requirements.md").write_text(f"# Spec {i}\n\nRequirements for spec {i}")
 
-            assert result.exit_code == 0
-            # Should show "and X more" for specs > 5
-            assert "more" in result.output or "Specs" in result.output
+        result = runner.invoke(cli, ["status"])
+
+        assert result.exit_code == 0
+        # Should show "and X more" for specs > 5
+        assert "more" in result.output or "Specs" in result.output
 
 
 class TestMainEntryPoint:
@@ -1,6 +1,8 @@
 """Tests for ldf.utils.config module."""
 
+import stat
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -43,6 +45,25 @@ class TestLoadConfig:
         config = load_config(tmp_path)
         assert config == {}
 
+    def test_caller_mutation_does_not_leak(self, temp_project: Path):
+        """Test that mutating a loaded config does not affect later loads."""
+        config = load_config(temp_project)
+        config["project"]["name"] = "mutated"
+
+        assert load_config(temp_project)["project"]["name"] != "mutated"
+
+    def test_reloads_after_edit(self, tmp_path: Path):
+        """Test that editing config.yaml is picked up by the next load."""
+        ldf_dir = tmp_path / ".ldf"
+        ldf_dir.mkdir()
+        config_path = ldf_dir / "config.yaml"
+        config_path.write_text('version: "1.0"\n')
+        assert load_config(tmp_path)["version"] == "1.0"
+
+        config_path.write_text('version: "2.10"\n')
+
+        assert load_config(tmp_path)["version"] == "2.10"
+
 
 class TestGetConfigValue:
     """Tests for get_config_value function."""
@@ -169,6 +190,36 @@ class TestSaveConfig:
         assert loaded["version"] == "2.0"
         assert loaded["project"]["name"] == "roundtrip"
 
+    def test_overwrites_atomically(self, tmp_path: Path):
+        """Test that saving replaces the config without leaving a temp file."""
+        save_config({"version": "1.0"}, tmp_path)
+        save_config({"version": "2.0"}, tmp_path)
+
+        ldf_dir = tmp_path / ".ldf"
+        assert load_config(tmp_path)["version"] == "2.0"
+        assert not (ldf_dir / "config.yaml.tmp").exists()
+
+    def test_removes_temp_file_on_failure(self, tmp_path: Path):
+        """Test that a failed save leaves no temp file and the old config intact."""
+        save_config({"version": "1.0"}, tmp_path)
+
+        with patch("ldf.utils.config.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_config({"version": "2.0"}, tmp_path)
+
+        assert not (tmp_path / ".ldf" / "config.yaml.tmp").exists()
+        assert load_config(tmp_path)["version"] == "1.0"
+
+    def test_preserves_file_mode(self, tmp_path: Path):
+        """Test that saving keeps the existing config's permissions."""
+        save_config({"version": "1.0"}, tmp_path)
+        config_path = tmp_path / ".ldf" / "config.yaml"
+        config_path.chmod(0o600)
+
+        save_config({"version": "2.0"}, tmp_path)
+
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+
 
 class TestConfigFunctionsWithCwd:
     """Tests for config functions using cwd as default."""
@@ -14,6 +14,7 @@ from ldf.coverage import (
     _upload_to_s3,
     compare_coverage,
     report_coverage,
+    save_coverage_snapshot,
     upload_coverage,
 )
 
@@ -21,13 +22,10 @@ from ldf.coverage import (
 class TestFindCoverageData:
     """Tests for _find_coverage_data function."""
 
-    def test_finds_coverage_json(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
-    ):
+    def test_finds_coverage_json(self, temp_project: Path, sample_pytest_coverage_json: dict):
         """Test finding coverage.json in project root."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = _find_coverage_data(temp_project)
 
@@ -35,47 +33,51 @@ class TestFindCoverageData:
         assert result["format"] == "pytest-cov"
         assert result["totals"]["percent"] == 85.0
 
-    def test_finds_ldf_coverage_json(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
-    ):
+    def test_finds_ldf_coverage_json(self, temp_project: Path, sample_pytest_coverage_json: dict):
         """Test finding .ldf/coverage.json."""
         coverage_file = temp_project / ".ldf" / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = _find_coverage_data(temp_project)
 
         assert result is not None
         assert result["format"] == "pytest-cov"
 
-    def test_finds_jest_coverage(
-        self, temp_project: Path, sample_jest_coverage_json: dict, monkeypatch
-    ):
+    def test_finds_jest_coverage(self, temp_project: Path, sample_jest_coverage_json: dict):
         """Test finding Jest coverage-summary.json."""
         coverage_dir = temp_project / "coverage"
         coverage_dir.mkdir()
         coverage_file = coverage_dir / "coverage-summary.json"
         coverage_file.write_text(json.dumps(sample_jest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = _find_coverage_data(temp_project)
 
         assert result is not None
         assert result["format"] == "jest"
 
-    def test_returns_none_when_no_coverage(self, temp_project: Path, monkeypatch):
+    def test_returns_none_when_no_coverage(self, temp_project: Path):
         """Test returning None when no coverage files exist."""
-        monkeypatch.chdir(temp_project)
-
         result = _find_coverage_data(temp_project)
 
         assert result is None
 
-    def test_skips_invalid_json(self, temp_project: Path, monkeypatch):
+    def test_skips_candidate_under_non_directory(
+        self, temp_project: Path, sample_pytest_coverage_json: dict
+    ):
+        """Test that a file named 'coverage' does not hide later candidates."""
+        (temp_project / "coverage").write_text("not a directory")
+        coverage_file = temp_project / ".ldf" / "coverage.json"
+        coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
+
+        result = _find_coverage_data(temp_project)
+
+        assert result is not None
+        assert result["format"] == "pytest-cov"
+
+    def test_skips_invalid_json(self, temp_project: Path):
         """Test skipping files with invalid JSON."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text("not valid json {{{")
-        monkeypatch.chdir(temp_project)
 
         result = _find_coverage_data(temp_project)
 
@@ -85,10 +87,8 @@ class TestFindCoverageData:
 class TestTryGenerateCoverage:
     """Tests for _try_generate_coverage function."""
 
-    def test_returns_none_without_coverage_file(self, temp_project: Path, monkeypatch):
+    def test_returns_none_without_coverage_file(self, temp_project: Path):
         """Test returning None when .coverage file doesn't exist."""
-        monkeypatch.chdir(temp_project)
-
         result = _try_generate_coverage(temp_project)
 
         assert result is None
@@ -97,7 +97,6 @@ class TestTryGenerateCoverage:
         """Test returning None when LDF_COVERAGE_WRITE is not set."""
         # Create .coverage file
         (temp_project / ".coverage").touch()
-        monkeypatch.chdir(temp_project)
         monkeypatch.delenv("LDF_COVERAGE_WRITE", raising=False)
 
         result = _try_generate_coverage(temp_project)
@@ -178,21 +177,18 @@ class TestFilterByService:
 class TestReportCoverage:
     """Tests for report_coverage function."""
 
-    def test_fails_without_ldf_directory(self, tmp_path: Path, monkeypatch):
+    def test_fails_without_ldf_directory(self, tmp_path: Path):
         """Test error when .ldf directory doesn't exist."""
-        monkeypatch.chdir(tmp_path)
-
-        result = report_coverage()
+        result = report_coverage(project_root=tmp_path)
 
         assert result.get("error") == "LDF not initialized"
 
     def test_reports_coverage_from_json(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
+        self, temp_project: Path, sample_pytest_coverage_json: dict
     ):
         """Test reporting coverage from coverage.json."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project)
 
@@ -200,45 +196,38 @@ class TestReportCoverage:
         assert result["coverage_percent"] == 85.0
         assert result["status"] == "PASS"  # 85% >= 80% threshold
 
-    def test_uses_config_thresholds(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
-    ):
+    def test_uses_config_thresholds(self, temp_project: Path, sample_pytest_coverage_json: dict):
         """Test that configured thresholds are used."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project)
 
         assert result["threshold_default"] == 80
         assert result["threshold_critical"] == 90
 
-    def test_handles_no_coverage_data(self, temp_project: Path, monkeypatch):
+    def test_handles_no_coverage_data(self, temp_project: Path):
         """Test handling when no coverage data exists."""
-        monkeypatch.chdir(temp_project)
-
         result = report_coverage(project_root=temp_project)
 
         assert result.get("error") == "No coverage data"
 
-    def test_handles_config_not_found(self, tmp_path: Path, monkeypatch, capsys):
+    def test_handles_config_not_found(self, tmp_path: Path):
         """Test handling when config file is missing."""
         # Create .ldf directory but no config.yaml
         ldf_dir = tmp_path / ".ldf"
         ldf_dir.mkdir()
-        monkeypatch.chdir(tmp_path)
 
         result = report_coverage(project_root=tmp_path)
 
         assert result.get("error") == "Config not found"
 
     def test_filters_by_service(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
+        self, temp_project: Path, sample_pytest_coverage_json: dict, capsys
     ):
         """Test filtering coverage by service."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         _result = report_coverage(project_root=temp_project, service="auth")
 
@@ -255,7 +244,6 @@ class TestTryGenerateCoverageAdvanced:
         monkeypatch.setenv("LDF_COVERAGE_WRITE", "1")
         # Mock shutil.which to return None (tool not found)
         monkeypatch.setattr("shutil.which", lambda x: None)
-        monkeypatch.chdir(temp_project)
 
         result = _try_generate_coverage(temp_project)
 
@@ -266,7 +254,6 @@ class TestTryGenerateCoverageAdvanced:
         (tmp_path / ".coverage").touch()
         monkeypatch.setenv("LDF_COVERAGE_WRITE", "1")
         monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/coverage")
-        monkeypatch.chdir(tmp_path)
 
         result = _try_generate_coverage(tmp_path)
 
@@ -306,12 +293,11 @@ class TestCoverageValidateFlag:
     """Tests for --validate flag."""
 
     def test_validate_passes_when_coverage_above_threshold(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
+        self, temp_project: Path, sample_pytest_coverage_json: dict
     ):
         """Test validate mode passes when coverage meets threshold."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))  # 85%
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project, validate=True)
 
@@ -319,7 +305,7 @@ class TestCoverageValidateFlag:
         # Validate mode should include validation message
         assert "validation" not in result.get("error", "")
 
-    def test_validate_fails_when_coverage_below_threshold(self, temp_project: Path, monkeypatch):
+    def test_validate_fails_when_coverage_below_threshold(self, temp_project: Path):
         """Test validate mode fails when coverage below threshold."""
         coverage_data = {
             "totals": {
@@ -331,7 +317,6 @@ class TestCoverageValidateFlag:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project, validate=True)
 
@@ -341,7 +326,7 @@ class TestCoverageValidateFlag:
 class TestCoverageVerboseFlag:
     """Tests for --verbose flag."""
 
-    def test_verbose_shows_all_files(self, temp_project: Path, monkeypatch, capsys):
+    def test_verbose_shows_all_files(self, temp_project: Path, capsys):
         """Test verbose mode shows all files not just bottom 10."""
         # Create coverage data with many files
         coverage_data = {
@@ -355,7 +340,6 @@ class TestCoverageVerboseFlag:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         _result = report_coverage(project_root=temp_project, verbose=True)
 
@@ -368,12 +352,11 @@ class TestCoverageGuardrailFilter:
     """Tests for --guardrail filter."""
 
     def test_guardrail_filter_shows_filter_message(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
+        self, temp_project: Path, sample_pytest_coverage_json: dict, capsys
     ):
         """Test that guardrail filter shows appropriate message."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         _result = report_coverage(project_root=temp_project, guardrail_id=1)
 
@@ -384,7 +367,7 @@ class TestCoverageGuardrailFilter:
 class TestGenerateReportAdvanced:
     """Advanced tests for report generation."""
 
-    def test_report_with_jest_file_format(self, temp_project: Path, monkeypatch):
+    def test_report_with_jest_file_format(self, temp_project: Path):
         """Test report with Jest coverage format files."""
         coverage_data = {
             "total": {"lines": {"covered": 400, "total": 500, "pct": 80.0}},
@@ -394,13 +377,12 @@ class TestGenerateReportAdvanced:
         coverage_file = temp_project / "coverage" / "coverage-summary.json"
         coverage_file.parent.mkdir()
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project)
 
         assert result["coverage_percent"] == 80.0
 
-    def test_report_with_many_files(self, temp_project: Path, monkeypatch, capsys):
+    def test_report_with_many_files(self, temp_project: Path, capsys):
         """Test report with more than 10 files shows truncation message."""
         # Create coverage data with many files
         coverage_data = {
@@ -414,14 +396,13 @@ class TestGenerateReportAdvanced:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         _result = report_coverage(project_root=temp_project)
 
         captured = capsys.readouterr()
         assert "more files" in captured.out
 
-    def test_report_fail_status(self, temp_project: Path, monkeypatch, capsys):
+    def test_report_fail_status(self, temp_project: Path, capsys):
         """Test report with failing coverage."""
         coverage_data = {
             "totals": {
@@ -433,7 +414,6 @@ class TestGenerateReportAdvanced:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project)
 
@@ -450,8 +430,6 @@ class TestSaveCoverageSnapshot:
         self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
     ):
         """Test saving a coverage snapshot."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Create a mock report
         report = {
             "coverage_percent": 85.0,
@@ -475,8 +453,6 @@ class TestSaveCoverageSnapshot:
 
     def test_creates_snapshots_dir(self, temp_project: Path):
         """Test that snapshots directory is created if needed."""
-        from ldf.coverage import save_coverage_snapshot
-
         report = {"coverage_percent": 75.0, "files": []}
 
         result = save_coverage_snapshot("test", report, project_root=temp_project)
@@ -486,8 +462,6 @@ class TestSaveCoverageSnapshot:
 
     def test_uses_cwd_when_no_root(self, temp_project: Path, monkeypatch):
         """Test using current directory when project_root is None."""
-        from ldf.coverage import save_coverage_snapshot
-
         monkeypatch.chdir(temp_project)
         report = {"coverage_percent": 80.0, "files": []}
 
@@ -500,11 +474,9 @@ class TestCompareCoverage:
     """Tests for compare_coverage function."""
 
     def test_compares_with_baseline(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
+        self, temp_project: Path, sample_pytest_coverage_json: dict, capsys
     ):
         """Test comparing current coverage with baseline."""
-        from ldf.coverage import compare_coverage, save_coverage_snapshot
-
         # Create baseline
         baseline_report = {
             "coverage_percent": 75.0,
@@ -517,7 +489,6 @@ class TestCompareCoverage:
         # Create current coverage (higher)
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("baseline", project_root=temp_project)
 
@@ -525,12 +496,8 @@ class TestCompareCoverage:
         assert "Coverage Comparison" in captured.out
         assert result.get("status") != "ERROR"
 
-    def test_error_when_baseline_not_found(self, temp_project: Path, monkeypatch, capsys):
+    def test_error_when_baseline_not_found(self, temp_project: Path, capsys):
         """Test error when baseline doesn't exist."""
-        from ldf.coverage import compare_coverage
-
-        monkeypatch.chdir(temp_project)
-
         result = compare_coverage("nonexistent", project_root=temp_project)
 
         assert result["status"] == "ERROR"
@@ -538,26 +505,19 @@ class TestCompareCoverage:
         captured = capsys.readouterr()
         assert "not found" in captured.out.lower()
 
-    def test_error_with_no_current_coverage(self, temp_project: Path, monkeypatch, capsys):
+    def test_error_with_no_current_coverage(self, temp_project: Path):
         """Test error when no current coverage exists."""
-        from ldf.coverage import compare_coverage, save_coverage_snapshot
-
         # Create baseline but no current coverage
         baseline_report = {"coverage_percent": 80.0, "files": []}
         save_coverage_snapshot("baseline", baseline_report, project_root=temp_project)
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("baseline", project_root=temp_project)
 
         assert result["status"] == "ERROR"
         assert "current coverage" in result["error"].lower()
 
-    def test_compares_with_file_path(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
-    ):
+    def test_compares_with_file_path(self, temp_project: Path, sample_pytest_coverage_json: dict):
         """Test comparing with a file path."""
-        from ldf.coverage import compare_coverage
-
         # Create baseline file
         baseline = {
             "coverage_percent": 70.0,
@@ -571,18 +531,15 @@ class TestCompareCoverage:
         # Create current coverage
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old-coverage.json", project_root=temp_project)
 
         assert result.get("status") != "ERROR"
 
     def test_shows_improved_files(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
+        self, temp_project: Path, sample_pytest_coverage_json: dict, capsys
     ):
         """Test showing improved files in diff."""
-        from ldf.coverage import compare_coverage, save_coverage_snapshot
-
         # Baseline with lower coverage
         baseline = {
             "coverage_percent": 50.0,
@@ -595,7 +552,6 @@ class TestCompareCoverage:
         # Current with higher coverage
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -608,8 +564,6 @@ class TestUploadCoverage:
 
     def test_uploads_to_file_destination(self, temp_project: Path, tmp_path: Path):
         """Test uploading coverage to a file destination."""
-        from ldf.coverage import upload_coverage
-
         report = {
             "coverage_percent": 85.0,
             "lines_covered": 850,
@@ -624,8 +578,6 @@ class TestUploadCoverage:
 
     def test_fails_with_unsupported_destination(self, temp_project: Path):
         """Test failure with unsupported destination type."""
-        from ldf.coverage import upload_coverage
-
         report = {"coverage_percent": 80.0}
 
         result = upload_coverage("ftp://unsupported", report, project_root=temp_project)
@@ -637,8 +589,6 @@ class TestUploadCoverage:
         # Mock import to fail for boto3
         import builtins
 
-        from ldf.coverage import upload_coverage
-
         original_import = builtins.__import__
 
         def mock_import(name, *args, **kwargs):
@@ -665,7 +615,6 @@ class TestTryGenerateCoverageEdgeCases:
         monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/coverage")
         # Mock os.access to return False for write permission
         monkeypatch.setattr("os.access", lambda path, mode: False)
-        monkeypatch.chdir(temp_project)
 
         result = _try_generate_coverage(temp_project)
 
@@ -678,7 +627,6 @@ class TestTryGenerateCoverageEdgeCases:
         (temp_project / ".coverage").touch()
         monkeypatch.setenv("LDF_COVERAGE_WRITE", "1")
         monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/coverage")
-        monkeypatch.chdir(temp_project)
 
         # Mock subprocess.run to return failure
         mock_result = MagicMock()
@@ -696,25 +644,20 @@ class TestTryGenerateCoverageEdgeCases:
 class TestCompareCoverageEdgeCases:
     """Edge case tests for compare_coverage function."""
 
-    def test_handles_invalid_baseline_json(self, temp_project: Path, monkeypatch, capsys):
+    def test_handles_invalid_baseline_json(self, temp_project: Path):
         """Test handling invalid JSON in baseline file."""
         # Create invalid baseline file
         baseline_path = temp_project / ".ldf" / "coverage-snapshots"
         baseline_path.mkdir(parents=True)
         (baseline_path / "broken.json").write_text("invalid json {{{")
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("broken", project_root=temp_project)
 
         assert result["status"] == "ERROR"
         assert "Invalid" in result["error"]
 
-    def test_shows_new_files(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
-    ):
+    def test_shows_new_files(self, temp_project: Path, sample_pytest_coverage_json: dict):
         """Test showing new files in comparison."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with fewer files
         baseline = {
             "coverage_percent": 70.0,
@@ -727,7 +670,6 @@ class TestCompareCoverageEdgeCases:
         # Current with files
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -735,10 +677,8 @@ class TestCompareCoverageEdgeCases:
         # Should have new files
         assert result.get("new_files_count", 0) >= 0
 
-    def test_shows_removed_files(self, temp_project: Path, monkeypatch, capsys):
+    def test_shows_removed_files(self, temp_project: Path):
         """Test showing removed files in comparison."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with files
         baseline = {
             "coverage_percent": 80.0,
@@ -762,17 +702,14 @@ class TestCompareCoverageEdgeCases:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
         assert result.get("status") != "ERROR"
         assert result.get("removed_files_count", 0) >= 0
 
-    def test_shows_regressed_files(self, temp_project: Path, monkeypatch, capsys):
+    def test_shows_regressed_files(self, temp_project: Path, capsys):
         """Test showing regressed files in comparison."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with high coverage
         baseline = {
             "coverage_percent": 90.0,
@@ -795,7 +732,6 @@ class TestCompareCoverageEdgeCases:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -804,10 +740,8 @@ class TestCompareCoverageEdgeCases:
         # Should show regression
         assert "Regressed" in captured.out or result.get("regressed_count", 0) >= 0
 
-    def test_unchanged_coverage(self, temp_project: Path, monkeypatch, capsys):
+    def test_unchanged_coverage(self, temp_project: Path):
         """Test comparison when coverage is unchanged."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline
         baseline = {
             "coverage_percent": 80.0,
@@ -824,7 +758,6 @@ class TestCompareCoverageEdgeCases:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -834,7 +767,7 @@ class TestCompareCoverageEdgeCases:
 class TestUploadToArtifact:
     """Tests for _upload_to_artifact function."""
 
-    def test_creates_artifact_directory(self, temp_project: Path, capsys):
+    def test_creates_artifact_directory(self, temp_project: Path):
         """Test that artifact directory is created."""
         data = {"coverage_percent": 85.0}
 
@@ -888,7 +821,7 @@ class TestUploadToS3:
         captured = capsys.readouterr()
         assert "Error" in captured.out
 
-    def test_successful_s3_upload(self, temp_project: Path, capsys):
+    def test_successful_s3_upload(self, temp_project: Path):
         """Test successful S3 upload."""
         data = {"coverage_percent": 80.0}
 
@@ -937,12 +870,11 @@ class TestGuardrailNotFound:
     """Tests for guardrail ID not found warning."""
 
     def test_warns_when_guardrail_not_found(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch, capsys
+        self, temp_project: Path, sample_pytest_coverage_json: dict, capsys
     ):
         """Test warning when specified guardrail ID doesn't exist."""
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         report_coverage(project_root=temp_project, guardrail_id=999)
 
@@ -953,10 +885,8 @@ class TestGuardrailNotFound:
 class TestListSnapshotsWhenEmpty:
     """Tests for listing snapshots when none exist."""
 
-    def test_shows_no_snapshots_message(self, temp_project: Path, monkeypatch, capsys):
+    def test_shows_no_snapshots_message(self, temp_project: Path, capsys):
         """Test message when no snapshots saved."""
-        monkeypatch.chdir(temp_project)
-
         result = compare_coverage("nonexistent", project_root=temp_project)
 
         assert result["status"] == "ERROR"
@@ -967,15 +897,12 @@ class TestListSnapshotsWhenEmpty:
 class TestListAvailableSnapshots:
     """Tests for listing available snapshots when baseline not found."""
 
-    def test_lists_available_snapshots(self, temp_project: Path, monkeypatch, capsys):
+    def test_lists_available_snapshots(self, temp_project: Path, capsys):
         """Test listing available snapshots when requested one is not found."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Create some snapshots
         report = {"coverage_percent": 80.0, "files": []}
         save_coverage_snapshot("baseline-1", report, project_root=temp_project)
         save_coverage_snapshot("baseline-2", report, project_root=temp_project)
-        monkeypatch.chdir(temp_project)
 
         # Request a non-existent snapshot
         result = compare_coverage("nonexistent", project_root=temp_project)
@@ -989,11 +916,9 @@ class TestCompareWithServiceFilter:
     """Tests for compare_coverage with service filter."""
 
     def test_compare_with_service_filter(
-        self, temp_project: Path, sample_pytest_coverage_json: dict, monkeypatch
+        self, temp_project: Path, sample_pytest_coverage_json: dict
     ):
         """Test comparing coverage with service filter."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Create baseline
         baseline = {
             "coverage_percent": 80.0,
@@ -1006,7 +931,6 @@ class TestCompareWithServiceFilter:
         # Current coverage
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(sample_pytest_coverage_json))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", service="auth", project_root=temp_project)
 
@@ -1017,10 +941,8 @@ class TestCompareWithServiceFilter:
 class TestCompareWithManyChanges:
     """Tests for compare_coverage with many file changes."""
 
-    def test_truncates_improved_files_list(self, temp_project: Path, monkeypatch, capsys):
+    def test_truncates_improved_files_list(self, temp_project: Path, capsys):
         """Test truncation when more than 5 improved files."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with low coverage for many files
         baseline_files = [{"path": f"src/file{i}.py", "percent": 50.0} for i in range(10)]
         baseline = {
@@ -1043,7 +965,6 @@ class TestCompareWithManyChanges:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -1052,10 +973,8 @@ class TestCompareWithManyChanges:
         # Should show truncation message for >5 improved files
         assert "and 5 more" in captured.out or result.get("improved_count", 0) > 5
 
-    def test_truncates_regressed_files_list(self, temp_project: Path, monkeypatch, capsys):
+    def test_truncates_regressed_files_list(self, temp_project: Path, capsys):
         """Test truncation when more than 5 regressed files."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with high coverage for many files
         baseline_files = [{"path": f"src/file{i}.py", "percent": 95.0} for i in range(10)]
         baseline = {
@@ -1078,7 +997,6 @@ class TestCompareWithManyChanges:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -1087,10 +1005,8 @@ class TestCompareWithManyChanges:
         # Should show truncation message for >5 regressed files
         assert "and 5 more" in captured.out or result.get("regressed_count", 0) > 5
 
-    def test_truncates_new_files_list(self, temp_project: Path, monkeypatch, capsys):
+    def test_truncates_new_files_list(self, temp_project: Path, capsys):
         """Test truncation when more than 3 new files."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with no files
         baseline = {
             "coverage_percent": 80.0,
@@ -1112,7 +1028,6 @@ class TestCompareWithManyChanges:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -1121,10 +1036,8 @@ class TestCompareWithManyChanges:
         # Should show truncation message for >3 new files
         assert "and 7 more" in captured.out or result.get("new_files_count", 0) > 3
 
-    def test_truncates_removed_files_list(self, temp_project: Path, monkeypatch, capsys):
+    def test_truncates_removed_files_list(self, temp_project: Path, capsys):
         """Test truncation when more than 3 removed files."""
-        from ldf.coverage import save_coverage_snapshot
-
         # Baseline with many files
         baseline_files = [{"path": f"src/oldfile{i}.py", "percent": 80.0} for i in range(10)]
         baseline = {
@@ -1142,7 +1055,6 @@ class TestCompareWithManyChanges:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = compare_coverage("old", project_root=temp_project)
 
@@ -1155,7 +1067,7 @@ class TestCompareWithManyChanges:
 class TestGenerateReportFileFormat:
     """Tests for _generate_report with different file formats."""
 
-    def test_file_without_summary_or_lines(self, temp_project: Path, monkeypatch):
+    def test_file_without_summary_or_lines(self, temp_project: Path):
         """Test handling file data without summary or lines key."""
         coverage_data = {
             "totals": {"covered_lines": 500, "num_statements": 1000, "percent_covered": 50.0},
@@ -1163,7 +1075,6 @@ class TestGenerateReportFileFormat:
         }
         coverage_file = temp_project / "coverage.json"
         coverage_file.write_text(json.dumps(coverage_data))
-        monkeypatch.chdir(temp_project)
 
         result = report_coverage(project_root=temp_project)
 
@@ -1180,13 +1091,12 @@ class TestGenerateReportFileFormat:
 class TestTryGenerateCoverageSuccess:
     """Tests for _try_generate_coverage success path."""
 
-    def test_success_path_reads_coverage_file(self, temp_project: Path, monkeypatch, capsys):
+    def test_success_path_reads_coverage_file(self, temp_project: Path, monkeypatch):
         """Test successful coverage generation reads the file."""
 
         (temp_project / ".coverage").touch()
         monkeypatch.setenv("LDF_COVERAGE_WRITE", "1")
         monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/coverage")
-        monkeypatch.chdir(temp_project)
 
         # Create the expected output file before subprocess runs
         coverage_file = temp_project / ".ldf" / "coverage.json"
@@ -1214,7 +1124,6 @@ class TestTryGenerateCoverageSuccess:
         (temp_project / ".coverage").touch()
         monkeypatch.setenv("LDF_COVERAGE_WRITE", "1")
         monkeypatch.setattr("shutil.which", lambda x: "/usr/bin/coverage")
-        monkeypatch.chdir(temp_project)
 
         # Mock subprocess.run to raise SubprocessError
         def mock_run(*args, **kwargs):
@@ -1248,7 +1157,7 @@ class TestUploadCoverageNoneRoot:
 class TestUploadToArtifactPath:
     """Tests for artifact upload path."""
 
-    def test_artifact_upload_writes_file(self, temp_project: Path, capsys):
+    def test_artifact_upload_writes_file(self, temp_project: Path):
         """Test that artifact upload writes the coverage file."""
         report = {
             "coverage_percent": 85.0,
@@ -289,6 +289,32 @@ overrides:
         assert guardrail_1.enabled is False
         assert guardrail_1.config.get("threshold") == 95
 
+    def test_overrides_do_not_leak_into_cached_core(self, temp_project: Path, tmp_path: Path):
+        """Test that overrides applied for one project don't alter cached core guardrails."""
+        guardrails_file = temp_project / ".ldf" / "guardrails.yaml"
+        guardrails_file.write_text("""version: "1.0"
+overrides:
+  "1":
+    config:
+      threshold: 95
+""")
+
+        load_guardrails(temp_project)
+        guardrails = load_guardrails(tmp_path)
+
+        guardrail_1 = next(g for g in guardrails if g.id == 1)
+        assert guardrail_1.config.get("threshold") != 95
+
+    def test_reloads_edited_project_config(self, temp_project: Path):
+        """Test that edits to guardrails.yaml are picked up on the next load."""
+        guardrails_file = temp_project / ".ldf" / "guardrails.yaml"
+        guardrails_file.write_text('version: "1.0"\n')
+        assert next(g for g in load_guardrails(temp_project) if g.id == 1).enabled is True
+
+        guardrails_file.write_text('version: "1.0"\ndisabled:\n  - 1\n')
+
+        assert next(g for g in load_guardrails(temp_project) if g.id == 1).enabled is False
+
     def test_adds_custom_guardrails(self, temp_project: Path):
         """Test adding custom guardrails from config."""
         guardrails_file = temp_project / ".ldf" / "guardrails.yaml"
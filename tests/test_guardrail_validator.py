@@ -3,6 +3,8 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 
 class TestGuardrailCoverageValidator:
     """Tests for GuardrailCoverageValidator class."""
@@ -77,6 +79,11 @@ class TestGuardrailCoverageValidator:
             assert isinstance(name, str)
             assert "Testing" in name
 
+            # Fallback is a read-only view of the class defaults, not a copy
+            with pytest.raises(TypeError):
+                validator._guardrails[1] = "Changed"  # type: ignore[index]
+            assert validator.DEFAULT_GUARDRAIL_NAMES[1] == "Testing Coverage"
+
     def test_caches_guardrails(self, temp_project: Path):
         """Test that guardrails are cached after first load."""
         from ldf._mcp_servers.coverage_reporter.guardrail_validator import (
@@ -93,3 +100,85 @@ class TestGuardrailCoverageValidator:
         guardrails2 = validator._guardrails
 
         assert guardrails1 is guardrails2  # Same object (cached)
+
+    def test_validate_matches_test_files_by_pattern(self, temp_project: Path):
+        """Test that test files are matched to guardrails case-insensitively."""
+        from ldf._mcp_servers.coverage_reporter.guardrail_validator import (
+            GuardrailCoverageValidator,
+        )
+
+        coverage_data = {
+            "files": {
+                "tests/test_Auth.py": {"summary": {"num_statements": 10, "covered_lines": 9}},
+                "tests/test_security_headers.py": {
+                    "summary": {"num_statements": 10, "covered_lines": 7}
+                },
+                "src/auth.py": {"summary": {"num_statements": 50, "covered_lines": 0}},
+                "tests/test_models.py": {"summary": {"num_statements": 5, "covered_lines": 5}},
+            }
+        }
+
+        validator = GuardrailCoverageValidator(temp_project)
+        result = validator.validate_guardrail_coverage(2, coverage_data)
+
+        assert result["test_count"] == 2
+        assert result["average_coverage"] == 80.0
+        assert result["valid"] is True
+
+    def test_validate_meta_guardrail_has_no_pattern(self, temp_project: Path):
+        """Test that meta-guardrails are valid without test patterns."""
+        from ldf._mcp_servers.coverage_reporter.guardrail_validator import (
+            GuardrailCoverageValidator,
+        )
+
+        validator = GuardrailCoverageValidator(temp_project)
+
+        assert validator.get_compiled_pattern(1) is None
+        result = validator.validate_guardrail_coverage(1, {"files": {}})
+        assert result["valid"] is True
+        assert result["test_count"] == 0
+
+    def test_validate_uses_each_coverage_report(self, temp_project: Path):
+        """Test that a new coverage report is not served from the previous one's test files."""
+        from ldf._mcp_servers.coverage_reporter.guardrail_validator import (
+            GuardrailCoverageValidator,
+        )
+
+        validator = GuardrailCoverageValidator(temp_project)
+        first = {
+            "files": {"tests/test_auth.py": {"summary": {"num_statements": 4, "covered_lines": 4}}}
+        }
+        second = {
+            "files": {
+                "tests/test_models.py": {"summary": {"num_statements": 4, "covered_lines": 4}}
+            }
+        }
+
+        assert validator.validate_guardrail_coverage(2, first)["test_count"] == 1
+        assert validator.validate_guardrail_coverage(3, first)["test_count"] == 0
+        assert validator.validate_guardrail_coverage(2, second)["test_count"] == 0
+
+    def test_validate_all_matches_per_guardrail_results(self, temp_project: Path):
+        """Test that validate_all agrees with validating each guardrail separately."""
+        from ldf._mcp_servers.coverage_reporter.guardrail_validator import (
+            GuardrailCoverageValidator,
+        )
+
+        coverage_data = {
+            "files": {
+                "tests/test_auth.py": {"summary": {"num_statements": 10, "covered_lines": 9}},
+                "tests/test_schema.py": {"summary": {"num_statements": 10, "covered_lines": 5}},
+                "tests/test_api_errors.py": {"summary": {"num_statements": 4, "covered_lines": 4}},
+                "src/schema.py": {"summary": {"num_statements": 50, "covered_lines": 0}},
+            }
+        }
+
+        validator = GuardrailCoverageValidator(temp_project)
+        results = validator.validate_all(coverage_data)
+
+        assert set(results) == set(range(1, 9))
+        for guardrail_id, result in results.items():
+            assert result == validator.validate_guardrail_coverage(guardrail_id, coverage_data)
+        # "schema" belongs to both Data Validation and Migrations
+        assert results[6]["test_count"] == 1
+        assert results[7]["test_count"] == 1
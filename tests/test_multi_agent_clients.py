@@ -0,0 +1,154 @@
+"""Tests for the multi-agent automation audit clients."""
+
+import importlib.util
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+AUTOMATION_DIR = Path(__file__).parent.parent / "multi-agent" / "automation"
+
+
+def _load_client_module(name: str) -> ModuleType:
+    """Load a client module by path; multi-agent/ is not an importable package."""
+    spec = importlib.util.spec_from_file_location(f"_audit_{name}", AUTOMATION_DIR / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up in sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+google_client = _load_client_module("google_client")
+openai_client = _load_client_module("openai_client")
+
+
+class TestGeminiParseResponse:
+    """Tests for GeminiAuditor._parse_response."""
+
+    def _parse(self, raw_response: str):
+        """Parse a response without constructing the API client."""
+        auditor = google_client.GeminiAuditor.__new__(google_client.GeminiAuditor)
+        return auditor._parse_response(
+            request_id="AUDIT-1",
+            audit_type="gap-analysis",
+            raw_response=raw_response,
+            timestamp=datetime(2026, 1, 1),
+        )
+
+    def test_parses_full_table_rows(self):
+        """Test that rows with ID, title and location are parsed."""
+        result = self._parse(
+            "| Gap ID | Title | Location |\n"
+            "|--------|-------|----------|\n"
+            "| G-001 | Missing auth | api.py |\n"
+        )
+
+        assert [(i.id, i.title, i.location) for i in result.issues] == [
+            ("G-001", "Missing auth", "api.py")
+        ]
+
+    def test_parses_rows_without_location(self):
+        """Test that rows with only an ID and description are kept."""
+        result = self._parse("| G-001 | Missing auth |\n| BC-002 | Low disk edge case |\n")
+
+        assert [(i.id, i.title, i.location) for i in result.issues] == [
+            ("G-001", "Missing auth", ""),
+            ("BC-002", "Low disk edge case", ""),
+        ]
+        assert result.issues[1].severity == "LOW"
+
+
+class _FakeCompletions:
+    """Stands in for client.chat.completions, streaming one canned response."""
+
+    def __init__(self, content: str, cached_tokens: int):
+        self.content = content
+        self.cached_tokens = cached_tokens
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        usage = SimpleNamespace(
+            prompt_tokens_details=SimpleNamespace(cached_tokens=self.cached_tokens)
+        )
+        chunks = [
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=self.content))],
+                usage=None,
+            ),
+            SimpleNamespace(choices=[], usage=usage),
+        ]
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        return stream()
+
+
+class TestChatGPTAuditor:
+    """Tests for ChatGPTAuditor."""
+
+    def _auditor(self, tmp_path: Path, completions: _FakeCompletions | None = None):
+        """Build an auditor around a fake API client."""
+        (tmp_path / "spec-review.md").write_text("Review this spec.")
+        auditor = openai_client.ChatGPTAuditor.__new__(openai_client.ChatGPTAuditor)
+        auditor.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        auditor.model = "gpt-4o"
+        auditor.max_tokens = 4000
+        auditor.prompts_dir = tmp_path
+        auditor.result_cache_size = 128
+        auditor._result_cache = OrderedDict()
+        auditor.max_concurrency = 10
+        auditor._prompt_cache = {}
+        return auditor
+
+    def test_parses_full_table_rows(self, tmp_path: Path):
+        """Test that rows with ID, title and location are parsed."""
+        result = self._auditor(tmp_path)._parse_response(
+            request_id="AUDIT-1",
+            audit_type="spec-review",
+            raw_response="| C-001 | SQL injection | db.py:10 |\n",
+            timestamp=datetime(2026, 1, 1),
+        )
+
+        assert [(i.id, i.severity, i.title, i.location) for i in result.issues] == [
+            ("C-001", "CRITICAL", "SQL injection", "db.py:10")
+        ]
+
+    def test_parses_rows_without_location(self, tmp_path: Path):
+        """Test that table rows with only an ID and description are kept."""
+        result = self._auditor(tmp_path)._parse_response(
+            request_id="AUDIT-1",
+            audit_type="spec-review",
+            raw_response="| H-001 | Missing rate limit |\n| L-002 | Typo in heading |\n",
+            timestamp=datetime(2026, 1, 1),
+        )
+
+        assert [(i.id, i.severity, i.title, i.location) for i in result.issues] == [
+            ("H-001", "HIGH", "Missing rate limit", ""),
+            ("L-002", "LOW", "Typo in heading", ""),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_independent_result(self, tmp_path: Path):
+        """Test that a cached result is copied and reports no token usage."""
+        completions = _FakeCompletions("| C-001 | SQL injection | db.py:10 |", cached_tokens=512)
+        auditor = self._auditor(tmp_path, completions)
+
+        first = await auditor.audit_spec("spec body", "spec-review")
+        second = await auditor.audit_spec("spec body", "spec-review")
+
+        assert completions.calls == 1
+        assert first.cached_prompt_tokens == 512
+        assert second.cached_prompt_tokens == 0
+        assert second.issues == first.issues
+        second.issues.clear()
+        assert len(first.issues) == 1
+        third = await auditor.audit_spec("spec body", "spec-review")
+        assert len(third.issues) == 1
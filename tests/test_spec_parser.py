@@ -1,13 +1,17 @@
 """Tests for ldf.utils.spec_parser module."""
 
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 from ldf.utils.spec_parser import (
     SpecInfo,
     SpecStatus,
     _determine_status,
+    clear_spec_cache,
     extract_guardrail_matrix,
     extract_tasks,
+    flush_spec_cache,
     get_spec_status,
     parse_spec,
 )
@@ -52,6 +56,21 @@ class TestExtractGuardrailMatrix:
         assert len(matrix) == 1
         assert matrix[0].guardrail_id == 1
 
+    def test_non_ascii_text_before_heading(self):
+        """Test that text whose lowercase form is longer doesn't shift the matrix section."""
+        content = "# Requirements\n\n" + "İ" * 200 + """
+
+##Guardrail Coverage Matrix
+
+| Guardrail | Requirements | Design | Tasks/Tests | Owner | Status |
+|-----------|--------------|--------|-------------|-------|--------|
+| 1. Testing Coverage | [US-1] | [S1] | [T-1] | Dev | TODO |
+| 2. Security Basics | [US-2] | [S2] | [T-2] | Dev | Done |
+"""
+        matrix = extract_guardrail_matrix(content)
+
+        assert [row.guardrail_id for row in matrix] == [1, 2]
+
     def test_returns_empty_list_when_no_matrix(self):
         """Test returns empty list when no matrix section exists."""
         content = """# Requirements
@@ -75,6 +94,23 @@ Some content here.
         assert len(matrix) == 1
         assert matrix[0].status == "N/A - not applicable"
 
+    def test_keeps_empty_trailing_cell(self):
+        """Test that an empty last cell keeps its column instead of dropping the row."""
+        content = """## Guardrail Coverage Matrix
+
+| Guardrail | Requirements | Design | Tasks/Tests | Owner | Status |
+|-----------|--------------|--------|-------------|-------|--------|
+| 1. Testing | [US-1] | [S1] | [T-1] | Alice ||
+| 2. Security | [US-2] | [S2] | [T-2] || DONE |
+"""
+        matrix = extract_guardrail_matrix(content)
+
+        assert len(matrix) == 2
+        assert matrix[0].owner == "Alice"
+        assert matrix[0].status == ""
+        assert matrix[1].owner == ""
+        assert matrix[1].status == "DONE"
+
 
 class TestExtractTasks:
     """Tests for extract_tasks function."""
@@ -428,6 +464,51 @@ Based on version 2.3, we need to implement feature X.
         assert tasks[1].dependencies == ["1.1"]
         assert tasks[2].dependencies == ["1.1", "1.1.1"]
 
+    def test_dependencies_on_following_line(self):
+        """Test that dependency IDs on the line after "Depends on:" are extracted."""
+        content = """# Tasks
+
+- [ ] **Task 1.1:** First task
+
+- [ ] **Task 1.2:** Second task
+  - Depends on:
+
+    Task 1.1
+
+- [ ] **Task 1.3:** Third task
+  - Depends on:
+- [ ] **Task 1.4:** Fourth task
+"""
+        tasks = extract_tasks(content)
+
+        assert len(tasks) == 4
+        assert tasks[1].dependencies == ["1.1"]
+        assert tasks[2].dependencies == []
+        assert tasks[3].dependencies == []
+
+    def test_checkboxes_before_first_task_are_ignored(self):
+        """Test that checkboxes outside any task section don't affect task status."""
+        content = """# Tasks
+
+- [ ] Review requirements
+- [x] Review design
+
+- [x] **Task 1.1:** First task
+  - [x] Subtask one
+  - **Depends on:** Task 0.1
+
+- [ ] **Task 1.2:** Second task
+  - [x] Subtask one
+  - [ ] Subtask two
+"""
+        tasks = extract_tasks(content)
+
+        assert len(tasks) == 2
+        assert tasks[0].status == "complete"
+        assert tasks[0].dependencies == ["0.1"]
+        assert tasks[1].status == "in_progress"
+        assert tasks[1].dependencies == []
+
     def test_indented_checklists(self):
         """Test that indented checklist tasks are recognized."""
         content = """# Tasks
@@ -504,6 +585,185 @@ Some stories.
         assert any("Question-Pack Answers" in e for e in spec_info.errors)
         assert any("Guardrail Coverage Matrix" in e for e in spec_info.errors)
 
+    def test_matrix_section_ends_at_next_heading(self, tmp_path: Path):
+        """Test that tables after the matrix section aren't parsed as matrix rows."""
+        spec_dir = tmp_path / "matrix-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("""# Requirements
+
+## Question-Pack Answers
+
+## Guardrail Coverage Matrix
+
+| Guardrail | Requirements | Design | Tasks/Tests | Owner | Status |
+|-----------|--------------|--------|-------------|-------|--------|
+| 1. Testing Coverage | [US-1] | [S3] | [T-1] | Alice | TODO |
+
+## Other Table
+| 2. Not A Row | a | b | c | d | e |
+
+### US-1: Login
+""")
+
+        spec_info = parse_spec(spec_dir)
+
+        assert [row.guardrail_id for row in spec_info.guardrail_matrix] == [1]
+        assert not any("user stories" in w for w in spec_info.warnings)
+
+    def test_accepts_suffixed_and_nested_section_headings(self, tmp_path: Path):
+        """Test that suffixed, h3 and closed-ATX headings still count as the sections."""
+        spec_dir = tmp_path / "heading-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("""# Requirements
+
+## Question-Pack Answers (v2)
+
+### Guardrail Coverage Matrix
+
+| Guardrail | Requirements | Design | Tasks/Tests | Owner | Status |
+|-----------|--------------|--------|-------------|-------|--------|
+| 1. Testing Coverage | [US-1] | [S3] | [T-1] | Alice | TODO |
+
+## User Stories ##
+""")
+
+        spec_info = parse_spec(spec_dir)
+
+        assert spec_info.errors == []
+        assert [row.guardrail_id for row in spec_info.guardrail_matrix] == [1]
+        assert not any("user stories" in w for w in spec_info.warnings)
+
+    def test_reparses_after_file_changes(self, tmp_path: Path):
+        """Test that edited spec files are re-read rather than served from cache."""
+        spec_dir = tmp_path / "edited-spec"
+        spec_dir.mkdir()
+        requirements = spec_dir / "requirements.md"
+        requirements.write_text("# Requirements\n")
+
+        assert parse_spec(spec_dir).requirements_approved is False
+
+        requirements.write_text("# Requirements\n\nStatus: Approved\n")
+
+        assert parse_spec(spec_dir).requirements_approved is True
+
+    def test_caches_unchanged_spec(self, tmp_path: Path):
+        """Test that an unchanged spec is served from cache until the cache is cleared."""
+        spec_dir = tmp_path / "cached-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+
+        first = parse_spec(spec_dir)
+
+        assert parse_spec(spec_dir) is first
+        clear_spec_cache()
+        assert parse_spec(spec_dir) is not first
+
+    def test_detects_added_files(self, tmp_path: Path):
+        """Test that adding a spec file invalidates the cached result."""
+        spec_dir = tmp_path / "growing-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+
+        assert parse_spec(spec_dir).has_design is False
+
+        (spec_dir / "design.md").write_text("# Design\n")
+
+        assert parse_spec(spec_dir).has_design is True
+
+    def test_ignores_directories_named_like_spec_files(self, tmp_path: Path):
+        """Test that only regular files count as spec files."""
+        spec_dir = tmp_path / "odd-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+        (spec_dir / "design.md").mkdir()
+
+        info = parse_spec(spec_dir)
+
+        assert info.has_requirements is True
+        assert info.has_design is False
+
+    def test_persists_results_for_ldf_specs(self, tmp_path: Path):
+        """Test that specs under .ldf/specs/ are restored from the on-disk cache."""
+        spec_dir = tmp_path / ".ldf" / "specs" / "disk-spec"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "requirements.md").write_text("# Requirements\n\nStatus: Approved\n")
+        (spec_dir / "tasks.md").write_text("- [x] **Task 1.1:** Done\n  - [x] Step\n")
+
+        first = parse_spec(spec_dir)
+        flush_spec_cache()
+        assert (tmp_path / ".ldf" / ".cache" / "spec_cache.json").exists()
+        assert (tmp_path / ".ldf" / ".cache" / ".gitignore").read_text() == "*\n"
+
+        clear_spec_cache()
+        with patch("ldf.utils.spec_parser._parse_spec_files") as mock_parse:
+            restored = parse_spec(spec_dir)
+
+        mock_parse.assert_not_called()
+        assert restored == first
+        assert restored.status == first.status
+        assert restored.tasks[0].status == "complete"
+
+    def test_ignores_unreadable_disk_cache(self, tmp_path: Path):
+        """Test that a corrupt on-disk cache is ignored and rewritten."""
+        spec_dir = tmp_path / ".ldf" / "specs" / "corrupt-cache"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+        cache_file = tmp_path / ".ldf" / ".cache" / "spec_cache.json"
+        cache_file.parent.mkdir()
+        cache_file.write_text("{not json")
+
+        assert parse_spec(spec_dir).has_requirements is True
+        flush_spec_cache()
+        assert "corrupt-cache" in cache_file.read_text()
+
+    def test_reads_and_writes_disk_cache_once_per_run(self, tmp_path: Path):
+        """Test that parsing many specs loads and saves the on-disk cache only once."""
+        specs_dir = tmp_path / ".ldf" / "specs"
+        for i in range(5):
+            spec_dir = specs_dir / f"spec-{i}"
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "requirements.md").write_text("# Requirements\n")
+
+        with (
+            patch("ldf.utils.spec_parser.json.loads", wraps=json.loads) as mock_loads,
+            patch("ldf.utils.spec_parser.json.dumps", wraps=json.dumps) as mock_dumps,
+        ):
+            for spec_dir in sorted(specs_dir.iterdir()):
+                parse_spec(spec_dir)
+            flush_spec_cache()
+
+        assert mock_loads.call_count <= 1
+        assert mock_dumps.call_count == 1
+        cached = json.loads((tmp_path / ".ldf" / ".cache" / "spec_cache.json").read_text())
+        assert sorted(cached["specs"]) == [f"spec-{i}" for i in range(5)]
+        assert cached["schema"] == 2
+
+    def test_leaves_project_untouched_until_flushed(self, tmp_path: Path):
+        """Test that parsing alone doesn't write the on-disk cache."""
+        spec_dir = tmp_path / ".ldf" / "specs" / "read-only"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+
+        parse_spec(spec_dir)
+        clear_spec_cache()
+
+        assert not (tmp_path / ".ldf" / ".cache").exists()
+
+    def test_flush_skips_write_without_new_results(self, tmp_path: Path):
+        """Test that flushing after only cache hits doesn't rewrite the cache file."""
+        spec_dir = tmp_path / ".ldf" / "specs" / "unchanged"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "requirements.md").write_text("# Requirements\n")
+        parse_spec(spec_dir)
+        flush_spec_cache()
+        clear_spec_cache()
+
+        with patch("ldf.utils.spec_parser._save_disk_cache") as mock_save:
+            parse_spec(spec_dir)
+            flush_spec_cache()
+
+        mock_save.assert_not_called()
+
 
 class TestSpecStatus:
     """Tests for SpecStatus enum and status detection."""
@@ -579,6 +839,35 @@ class TestExtractGuardrailMatrixEdgeCases:
         assert matrix[1].guardrail_id == 2
         assert matrix[1].status == "N/A - no auth"
 
+    def test_starts_search_at_offset(self):
+        """Test that a start offset skips content before the matrix heading."""
+        preamble = "# Requirements\n\nSee the matrix below.\n\n"
+        content = preamble + """## Guardrail Coverage Matrix
+
+| Guardrail | Requirements | Design | Tasks/Tests | Owner | Status |
+|-----------|--------------|--------|-------------|-------|--------|
+| 1. Testing Coverage | [US-1] | [S1] | [T-1] | Dev | TODO |
+"""
+
+        assert len(extract_guardrail_matrix(content, len(preamble))) == 1
+        assert extract_guardrail_matrix(content, len(preamble) + 1) == []
+
+    def test_does_not_read_table_from_next_section(self):
+        """Test that a matrix section without a table doesn't borrow a later table."""
+        content = """## Guardrail Coverage Matrix
+TODO: fill in the matrix.
+
+## Data Model
+| 1. Users | id | name | email | created | updated |
+"""
+        assert extract_guardrail_matrix(content) == []
+
+    def test_handles_pathological_input_quickly(self):
+        """Test that a long table-like section parses in linear time."""
+        content = "## Guardrail Coverage Matrix\n|" + " |" * 50000 + "\n" + "\n" * 50000
+
+        assert extract_guardrail_matrix(content) == []
+
 
 class TestExtractTasksEdgeCases:
     """Edge case tests for extract_tasks."""
@@ -709,6 +998,20 @@ Checklist here.
 
         assert spec_info.tasks_approved is True
 
+    def test_detects_approval_with_irregular_spacing(self, tmp_path: Path):
+        """Test approval markers with extra whitespace or no space are still detected."""
+        spec_dir = tmp_path / "spacing-spec"
+        spec_dir.mkdir()
+        (spec_dir / "requirements.md").write_text("# Requirements\n\nSTATUS:\tApproved\n")
+        (spec_dir / "design.md").write_text("# Design\n\n- [X]Design approved\n")
+        (spec_dir / "tasks.md").write_text("# Tasks\n\nNot approved yet.\n")
+
+        spec_info = parse_spec(spec_dir)
+
+        assert spec_info.requirements_approved is True
+        assert spec_info.design_approved is True
+        assert spec_info.tasks_approved is False
+
 
 class TestDetermineStatus:
     """Tests for _determine_status function."""
@@ -237,12 +237,10 @@ class TestWorkspaceAdd:
             assert result.exit_code == 1
             assert "Not in a workspace" in result.output
 
-    def test_add_project(self, runner, tmp_path):
+    def test_add_project(self, runner, tmp_path, monkeypatch):
         """Test adding a project to workspace."""
-        import os
-
         # Initialize workspace first
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         # Create a project directory
@@ -259,11 +257,9 @@ class TestWorkspaceAdd:
         assert len(data["projects"]["explicit"]) == 1
         assert data["projects"]["explicit"][0]["alias"] == "auth"
 
-    def test_add_with_custom_alias(self, runner, tmp_path):
+    def test_add_with_custom_alias(self, runner, tmp_path, monkeypatch):
         """Test adding a project with custom alias."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         project = tmp_path / "services" / "auth"
@@ -273,11 +269,9 @@ class TestWorkspaceAdd:
         assert result.exit_code == 0
         assert "Added project 'authentication'" in result.output
 
-    def test_add_duplicate_alias_fails(self, runner, tmp_path):
+    def test_add_duplicate_alias_fails(self, runner, tmp_path, monkeypatch):
         """Test adding project with duplicate alias fails."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         project1 = tmp_path / "services" / "auth1"
@@ -290,11 +284,9 @@ class TestWorkspaceAdd:
         assert result.exit_code == 1
         assert "already exists" in result.output
 
-    def test_add_duplicate_path_skipped(self, runner, tmp_path):
+    def test_add_duplicate_path_skipped(self, runner, tmp_path, monkeypatch):
         """Test adding same project path is skipped."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         project = tmp_path / "services" / "auth"
@@ -306,11 +298,9 @@ class TestWorkspaceAdd:
         assert result.exit_code == 0
         assert "already in workspace" in result.output
 
-    def test_add_warns_if_no_ldf(self, runner, tmp_path):
+    def test_add_warns_if_no_ldf(self, runner, tmp_path, monkeypatch):
         """Test add warns if project doesn't have LDF initialized."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         project = tmp_path / "services" / "auth"
@@ -614,12 +604,10 @@ class TestWorkspaceListRichOutput:
 class TestWorkspaceReportFull:
     """Full tests for workspace report command."""
 
-    def test_report_json_output(self, runner, tmp_path):
+    def test_report_json_output(self, runner, tmp_path, monkeypatch):
         """Test report with JSON output."""
-        import os
-
         # Create workspace with a project
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         project = tmp_path / "services" / "auth"
@@ -642,11 +630,9 @@ class TestWorkspaceReportFull:
         assert "summary" in data
         assert "projects" in data
 
-    def test_report_html_output(self, runner, tmp_path):
+    def test_report_html_output(self, runner, tmp_path, monkeypatch):
         """Test report with HTML output."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         result = runner.invoke(workspace, ["report", "--format", "html"])
@@ -658,11 +644,9 @@ class TestWorkspaceReportFull:
         html_content = html_path.read_text()
         assert "<html>" in html_content
 
-    def test_report_json_to_file(self, runner, tmp_path):
+    def test_report_json_to_file(self, runner, tmp_path, monkeypatch):
         """Test report JSON output to file."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         output_file = tmp_path / "report.json"
@@ -672,11 +656,9 @@ class TestWorkspaceReportFull:
         assert result.exit_code == 0
         assert output_file.exists()
 
-    def test_report_handles_malformed_registry(self, runner, tmp_path):
+    def test_report_handles_malformed_registry(self, runner, tmp_path, monkeypatch):
         """Test report gracefully handles malformed .registry.yaml."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         # Create a project
@@ -703,11 +685,9 @@ class TestWorkspaceReportFull:
         data = json.loads(result.output)
         assert "projects" in data
 
-    def test_report_handles_empty_registry(self, runner, tmp_path):
+    def test_report_handles_empty_registry(self, runner, tmp_path, monkeypatch):
         """Test report gracefully handles empty .registry.yaml (None)."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         # Create a project
@@ -733,11 +713,9 @@ class TestWorkspaceReportFull:
 class TestWorkspaceGraphFull:
     """Full tests for workspace graph command."""
 
-    def test_graph_mermaid_output(self, runner, tmp_path):
+    def test_graph_mermaid_output(self, runner, tmp_path, monkeypatch):
         """Test graph with mermaid output."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         # Create projects with references
@@ -758,22 +736,18 @@ class TestWorkspaceGraphFull:
         assert result.exit_code == 0
         assert "graph LR" in result.output
 
-    def test_graph_dot_output(self, runner, tmp_path):
+    def test_graph_dot_output(self, runner, tmp_path, monkeypatch):
         """Test graph with DOT output."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         result = runner.invoke(workspace, ["graph", "--format", "dot"])
         assert result.exit_code == 0
         assert "digraph workspace" in result.output
 
-    def test_graph_json_output(self, runner, tmp_path):
+    def test_graph_json_output(self, runner, tmp_path, monkeypatch):
         """Test graph with JSON output."""
-        import os
-
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         runner.invoke(workspace, ["init"])
 
         result = runner.invoke(workspace, ["graph", "--format", "json"])
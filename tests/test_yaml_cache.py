@@ -0,0 +1,42 @@
+"""Tests for ldf.utils.yaml_cache module."""
+
+from pathlib import Path
+
+import pytest
+
+from ldf.utils.yaml_cache import load_yaml_cached
+
+
+class TestLoadYamlCached:
+    """Tests for load_yaml_cached function."""
+
+    def test_loads_yaml_file(self, tmp_path: Path):
+        """Test loading a YAML file."""
+        path = tmp_path / "data.yaml"
+        path.write_text("name: test\nitems: [1, 2]\n")
+
+        assert load_yaml_cached(path) == {"name": "test", "items": [1, 2]}
+
+    def test_caller_mutation_does_not_leak(self, tmp_path: Path):
+        """Test that mutating a loaded result does not affect later loads."""
+        path = tmp_path / "data.yaml"
+        path.write_text("items: [1, 2]\n")
+
+        load_yaml_cached(path)["items"].append(3)
+
+        assert load_yaml_cached(path) == {"items": [1, 2]}
+
+    def test_reloads_after_edit(self, tmp_path: Path):
+        """Test that editing the file is picked up by the next load."""
+        path = tmp_path / "data.yaml"
+        path.write_text("version: 1\n")
+        assert load_yaml_cached(path) == {"version": 1}
+
+        path.write_text("version: 22\n")
+
+        assert load_yaml_cached(path) == {"version": 22}
+
+    def test_raises_on_missing_file(self, tmp_path: Path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_yaml_cached(tmp_path / "missing.yaml")